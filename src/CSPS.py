@@ -8,4 +8,31 @@ def MapColoringCSP(colors, neighbors):
     specified as a string of the form defined by parse_neighbors."""
     if isinstance(neighbors, str):
         neighbors = parse_neighbors(neighbors)
-    return CSP(list(neighbors.keys()), UniversalDict(colors), neighbors, different_values_constraint)
\ No newline at end of file
+    return CSP(list(neighbors.keys()), UniversalDict(colors), neighbors, different_values_constraint)
+
+# The extra region of Asterisk Sudoku: the 9 cells of the asterisk, as (row, column)
+asterisk_cells = [(1, 4), (2, 2), (2, 6), (4, 1), (4, 4), (4, 7), (6, 2), (6, 6), (7, 4)]
+
+
+def SudokuCSP(grid, asterisk=False):
+    """Make a CSP for a 9x9 Sudoku. grid is a string of 81 digits read row
+    by row, with '0' or '.' for an empty cell. The variables are named
+    'A1'..'I9' (row letter, column number) and the values are ints 1..9.
+    With asterisk=True the asterisk cells must also be all different
+    (Asterisk Sudoku)."""
+    rows, cols = 'ABCDEFGHI', '123456789'
+    cells = [r + c for r in rows for c in cols]
+    units = [[r + c for c in cols] for r in rows]
+    units += [[r + c for r in rows] for c in cols]
+    units += [[rows[3*i + r] + cols[3*j + c] for r in range(3) for c in range(3)]
+              for i in range(3) for j in range(3)]
+    if asterisk:
+        units.append([rows[r] + cols[c] for (r, c) in asterisk_cells])
+    neighbors = {cell: set() for cell in cells}
+    for unit in units:
+        for cell in unit:
+            neighbors[cell].update(other for other in unit if other != cell)
+    neighbors = {cell: sorted(others) for (cell, others) in neighbors.items()}
+    domains = {cell: [int(ch)] if ch in '123456789' else list(range(1, 10))
+               for (cell, ch) in zip(cells, grid)}
+    return CSP(cells, domains, neighbors, different_values_constraint)
@@ -1,6 +1,18 @@
 #How do we decide which node from the frontier to expand next?
-from src.nodeClass import Node
+from src.nodeClass import Node, CompactNode
+from src.contractionHierarchyClass import ContractionHierarchy
+from src.distanceMatrixClass import DistanceMatrix
+from src.hpaStarClass import HPAStar
+from src.stateTableClass import StateTable
+from src.searchTraceClass import SearchTrace
+from src.tracerClass import NO_TRACE
+from src.searchStatsClass import NO_STATS, measured
 from queue import PriorityQueue
+from collections import deque
+import heapq
+import numbers
+import time
+import weakref
 
 import math
 
@@ -12,46 +24,160 @@ nodeColors={
 }
 
 
-def A_StarSearchAgentProgram(f=None):
+def A_StarSearchAgentProgram(f=None, tracer=None, stats=None):
   
-    #f=math.dist
+    #f=math.dist by default; with several goals h is the smallest f to any of them
+    tracer = tracer or NO_TRACE
+    stats = stats or NO_STATS
     
     def program(problem):
-      print("Hi")
+      if tracer.enabled:
+        tracer.emit("Hi")
 
       node = Node(problem.initial)
+      to_goal = heuristic_to_goal(f if f is not None else math.dist, problem)
  
       frontier = PriorityQueue()
-      h=node.path_cost+round(math.dist(node.state, problem.goal),3)
+      h=node.path_cost+to_goal(node.state)
       frontier.put((h,node))
       reached = {problem.initial:node}
 
-      while frontier:
-        print(frontier.queue)
+      while not frontier.empty():
+        if tracer.enabled:
+          tracer.emit(frontier.queue)
         node = frontier.get()[1]
-        print("The node {} is extracted from frontier:".format(node.state))
+        if tracer.enabled:
+          tracer.emit("The node {} is extracted from frontier:".format(node.state))
 
         if problem.goal_test(node.state):
-          print("We have found our goal: {}".format (node.state))
+          if tracer.enabled:
+            tracer.emit("We have found our goal: {}".format (node.state))
           return node
 
         #reached.add(node.state)
+        if stats.enabled:
+          stats.expanded += 1
         for child in node.expand(problem):
+            if stats.enabled:
+              stats.generated += 1
             if child.state not in reached or child.path_cost<reached[child.state].path_cost:
                 #print(child)
-                print("The child node {}.".format(child))
-                h=child.path_cost+round(f(child.state, problem.goal),3)
+                if tracer.enabled:
+                  tracer.emit("The child node {}.".format(child))
+                if stats.enabled and child.state in reached:
+                  stats.reopened += 1
+                h=child.path_cost+to_goal(child.state)
                 frontier.put((h,child))
                 reached.update({child.state:child})
+        if stats.enabled:
+          stats.frontier(frontier.qsize())
             
       return None
 
+    return measured(stats, program)
+
+
+def ARA_StarSearchAgentProgram(f=None, w=2.5, step=0.5, time_limit=None, max_expansions=None, stats=None):
+  #Anytime repairing A* (ARA*): weighted A* with g+w*h, first with a large weight w
+  #for a quick solution, then again with w lowered by step until w is 1.
+  #program(problem) is a generator of better and better solution nodes: the k-th one costs
+  #at most w_k times the optimum (for a consistent f) and the last one with w=1 is optimal.
+  #The searches share g values and the frontier: a state improved after it was expanded
+  #waits in INCONS for the next weight instead of being expanded again at once.
+  #It stops early after time_limit seconds or max_expansions expansions (yielding first the
+  #best solution found so far, if it is better than the last one and not proven w-suboptimal yet),
+  #e.g. anytime_best(program(problem)) is the best solution found within the budget.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      stats.start()
+      try:
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        h = heuristic_to_goal(f, problem)
+        weight = w
+        root = CompactNode(problem.initial)
+        best = {root.state: root}
+        opened = {root.state: weight * h(root.state)}
+        frontier = [(opened[root.state], 0, root.state)]
+        closed, incons = set(), set()
+        counter, expanded = 1, 0
+        goal, last_cost = None, math.inf
+        in_budget = True
+
+        def push(state):
+          nonlocal counter
+          opened[state] = best[state].path_cost + weight * h(state)
+          heapq.heappush(frontier, (opened[state], counter, state))
+          counter += 1
+
+        while True:
+          #ImprovePath: expand while a state may still lead to a cheaper goal
+          while frontier:
+            key, _, state = frontier[0]
+            if opened.get(state) != key:
+              heapq.heappop(frontier)
+              continue
+            if goal is not None and best[goal].path_cost <= key:
+              break
+            if (max_expansions is not None and expanded >= max_expansions) or (deadline is not None and time.perf_counter() > deadline):
+              in_budget = False
+              break
+            heapq.heappop(frontier)
+            del opened[state]
+            closed.add(state)
+            node = best[state]
+            if problem.goal_test(state) and (goal is None or node.path_cost < best[goal].path_cost):
+              goal = state
+            expanded += 1
+            if stats.enabled:
+              stats.expanded += 1
+            for child in node.expand(problem):
+              if stats.enabled:
+                stats.generated += 1
+              if child.state in best and best[child.state].path_cost <= child.path_cost:
+                continue
+              best[child.state] = child
+              if problem.goal_test(child.state) and (goal is None or child.path_cost < best[goal].path_cost):
+                goal = child.state
+              if child.state in closed:
+                incons.add(child.state)
+                if stats.enabled:
+                  stats.reopened += 1
+              else:
+                push(child.state)
+            if stats.enabled:
+              stats.frontier(len(opened))
+
+          if goal is not None and best[goal].path_cost < last_cost:
+            last_cost = best[goal].path_cost
+            yield best[goal]
+          if not in_budget or weight <= 1 or not (opened or incons):
+            return
+          #next weight: move INCONS into OPEN, update all keys, forget CLOSED
+          weight = max(1, weight - step)
+          states = list(opened) + list(incons)
+          frontier = []
+          for state in states:
+            push(state)
+          closed, incons = set(), set()
+      finally:
+        stats.stop()
+
     return program
 
 
+def anytime_best(solutions):
+  """Return the last (best) solution of an anytime program's generator, or None."""
+  node = None
+  for node in solutions:
+    pass
+  return node
 
-def BestFirstSearchAgentProgram(f=None):
+
+def BestFirstSearchAgentProgram(f=None, tracer=None, stats=None):
   #with BFS we choose a node, n, with minimum value of some evaluation function, f (n).
+    tracer = tracer or NO_TRACE
+    stats = stats or NO_STATS
     
     def program(problem):
 
@@ -60,32 +186,633 @@ def BestFirstSearchAgentProgram(f=None):
       #print(node.state)
       frontier = PriorityQueue()
       frontier.put((1,node))
-      print(f"The {node} is being pushed to frontier ...")
+      if tracer.enabled:
+        tracer.emit(f"The {node} is being pushed to frontier ...")
       #node.color=nodeColors["frontier"]
       reached = {problem.initial:node}
 
-      while frontier:
+      while not frontier.empty():
         node = frontier.get()[1]
         #node.color=nodeColors["expanded"]
-        print(f"The {node} is being extracted from frontier ...")
+        if tracer.enabled:
+          tracer.emit(f"The {node} is being extracted from frontier ...")
 
         if problem.goal_test(node.state):
           node.color=nodeColors["goal"]
-          print(f"We have found our goal:  {node}!")
+          if tracer.enabled:
+            tracer.emit(f"We have found our goal:  {node}!")
           return node
 
         #reached.add(node.state)
+        if stats.enabled:
+          stats.expanded += 1
         for child in node.expand(problem):
+            if stats.enabled:
+              stats.generated += 1
             if child.state not in reached or child.path_cost<reached[child.state].path_cost:
+                if stats.enabled and child.state in reached:
+                  stats.reopened += 1
                 frontier.put((1,child))
-                print(f"The child {child} is being pushed to frontier ...")
+                if tracer.enabled:
+                  tracer.emit(f"The child {child} is being pushed to frontier ...")
                 #child.color=nodeColors["frontier"]
                 reached.update({child.state:child})
+        if stats.enabled:
+          stats.frontier(frontier.qsize())
             
         #node.color=nodeColors["expanded"]
       return None
 
-    return program
+    return measured(stats, program)
+
+
+def GreedyBestFirstSearchAgentProgram(f=None, evaluation=None, max_frontier=None, stats=None):
+  #Best-first search that expands the frontier node with the smallest evaluation(node);
+  #by default evaluation is the heuristic f(state, goal), i.e. greedy best-first search.
+  #With max_frontier the frontier is bounded: when it grows to twice that size only the
+  #max_frontier best nodes are kept, so memory is predictable but the search may miss a goal.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      h = heuristic_to_goal(f, problem)
+      evaluate = evaluation or (lambda node: h(node.state))
+      node = CompactNode(problem.initial)
+      frontier = [(evaluate(node), 0, node)]
+      reached = {node.state: node.path_cost}
+      counter = 1
+      while frontier:
+        node = heapq.heappop(frontier)[2]
+        if node.path_cost > reached.get(node.state, math.inf):
+          continue
+        if problem.goal_test(node.state):
+          return node
+        if stats.enabled:
+          stats.expanded += 1
+        for child in node.expand(problem):
+          if stats.enabled:
+            stats.generated += 1
+          if child.state not in reached or child.path_cost < reached[child.state]:
+            reached[child.state] = child.path_cost
+            heapq.heappush(frontier, (evaluate(child), counter, child))
+            counter += 1
+        if max_frontier is not None and len(frontier) >= 2 * max_frontier:
+          frontier = heapq.nsmallest(max_frontier, frontier)
+        if stats.enabled:
+          stats.frontier(len(frontier))
+      return None
+
+    return measured(stats, program)
+
+
+def BeamSearchAgentProgram(f=None, width=100, evaluation=None, stats=None):
+  #Beam search: best-first layer by layer, keeping only the width best nodes of every layer
+  #(by evaluation(node), the heuristic f(state, goal) by default) in a bounded heap.
+  #Memory and time per layer are fixed by width; the price is completeness and optimality.
+  #States are not entered twice, so the search ends when a layer has nothing new.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      h = heuristic_to_goal(f, problem)
+      evaluate = evaluation or (lambda node: h(node.state))
+      beam = [CompactNode(problem.initial)]
+      visited = {problem.initial}
+      counter = 0
+      while beam:
+        for node in beam:
+          if problem.goal_test(node.state):
+            return node
+        #the width best children: a max-heap of (-value, -counter) drops the worst one
+        best, layer = [], set()
+        for node in beam:
+          if stats.enabled:
+            stats.expanded += 1
+          for child in node.expand(problem):
+            if stats.enabled:
+              stats.generated += 1
+            if child.state in visited or child.state in layer:
+              continue
+            layer.add(child.state)
+            counter += 1
+            entry = (-evaluate(child), -counter, child)
+            if len(best) < width:
+              heapq.heappush(best, entry)
+            else:
+              heapq.heappushpop(best, entry)
+        beam = [child for (_, _, child) in sorted(best, reverse=True)]
+        visited.update(child.state for child in beam)
+        if stats.enabled:
+          stats.frontier(len(beam))
+      return None
+
+    return measured(stats, program)
+
+
+#graph: ((graph.version, max_cost), bound) of small_integer_edge_costs
+_edge_cost_bounds = weakref.WeakKeyDictionary()
+
+
+def small_integer_edge_costs(graph, max_cost=16):
+  """Return the largest edge cost of graph if every cost is a non-negative
+  integer (int or numpy integer) not bigger than max_cost (e.g. 0, 1 or 2
+  for mazeGraph);
+  otherwise return None. The answer is kept until graph.version changes,
+  and a CSRGraph is checked on its cost array at once."""
+  key = (graph.version, max_cost)
+  cached = _edge_cost_bounds.get(graph)
+  if cached is not None and cached[0] == key:
+    return cached[1]
+  costs = getattr(graph, 'costs', None)
+  if hasattr(costs, 'dtype'):
+    if costs.dtype.kind not in 'iu':
+      largest = None
+    elif len(costs) == 0:
+      largest = 0
+    else:
+      largest = int(costs.max())
+      if costs.min() < 0 or largest > max_cost:
+        largest = None
+  else:
+    largest = 0
+    for links in graph.graph_dict.values():
+      if largest is None:
+        break
+      for cost in links.values():
+        if not isinstance(cost, numbers.Integral) or cost < 0 or cost > max_cost:
+          largest = None
+          break
+        largest = max(largest, int(cost))
+  _edge_cost_bounds[graph] = (key, largest)
+  return largest
+
+
+def DialSearchAgentProgram(max_cost=16, states=None, stats=None):
+  #Uniform-cost search with a bucket queue (Dial's algorithm, 0-1 BFS when costs are 0/1).
+  #Works in O(V+E+C*D) for graphs with small integer edge costs like mazeGraph,
+  #and falls back to a binary heap for any other graph.
+  #States are interned in a StateTable (pass one to share the ids between calls),
+  #so the best costs live in a list indexed by state id.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      table = states if states is not None else StateTable()
+      best = []
+
+      def cost_of(i):
+        if i >= len(best):
+          best.extend([math.inf] * (i + 1 - len(best)))
+        return best[i]
+
+      node = CompactNode(problem.initial)
+      start = table.id_of(node.state)
+      cost_of(start)
+      best[start] = 0
+      C = small_integer_edge_costs(problem.graph, max_cost)
+
+      if C is None:
+        #not a small-integer-weight graph: plain Dijkstra on a heap
+        frontier = [(0, start, node)]
+        while frontier:
+          cost, i, node = heapq.heappop(frontier)
+          if cost > best[i]:
+            continue
+          if problem.goal_test(node.state):
+            return node
+          if stats.enabled:
+            stats.expanded += 1
+          for child in node.expand(problem):
+            k = table.id_of(child.state)
+            if stats.enabled:
+              stats.generated += 1
+              if child.path_cost < cost_of(k) < math.inf:
+                stats.reopened += 1
+            if child.path_cost < cost_of(k):
+              best[k] = child.path_cost
+              heapq.heappush(frontier, (child.path_cost, k, child))
+          if stats.enabled:
+            stats.frontier(len(frontier))
+        return None
+
+      #C+1 circular buckets are enough: every node in the queue has cost in [d, d+C]
+      buckets = [deque() for _ in range(C + 1)]
+      buckets[0].append((start, node))
+      size, d = 1, 0
+      while size:
+        bucket = buckets[d % (C + 1)]
+        if not bucket:
+          d += 1
+          continue
+        i, node = bucket.popleft()
+        size -= 1
+        if node.path_cost > best[i]:
+          continue
+        if problem.goal_test(node.state):
+          return node
+        if stats.enabled:
+          stats.expanded += 1
+        for child in node.expand(problem):
+          k = table.id_of(child.state)
+          if stats.enabled:
+            stats.generated += 1
+            if child.path_cost < cost_of(k) < math.inf:
+              stats.reopened += 1
+          if child.path_cost < cost_of(k):
+            best[k] = child.path_cost
+            buckets[child.path_cost % (C + 1)].append((k, child))
+            size += 1
+        if stats.enabled:
+          stats.frontier(size)
+      return None
+
+    return measured(stats, program)
+
+
+def action_between(problem, state, target):
+  """Return the cheapest action of problem that leads from state to target."""
+  best = None
+  for action in problem.actions(state):
+    if problem.result(state, action) == target:
+      cost = problem.path_cost(0, state, action, target)
+      if best is None or cost < best[0]:
+        best = (cost, action)
+  return best[1] if best else None
+
+
+def node_from_states(problem, states):
+  """Return the Node chain of problem along a list of states (None for no path)."""
+  if states is None:
+    return None
+  node = CompactNode(states[0])
+  for (a, b) in zip(states[:-1], states[1:]):
+    node = node.child_node(problem, action_between(problem, a, b))
+  return node
+
+
+def BidirectionalSearchAgentProgram(f=None, stats=None):
+  #Bidirectional Dijkstra (or bidirectional A* if a consistent heuristic f(state, goal) is given).
+  #The backward search follows problem.graph.predecessors, so it works for
+  #undirected Graphs as well as for directed ones like mazeGraph.
+  #With a heuristic both searches use the average potential p(s)=(f(s,goal)-f(initial,s))/2,
+  #and we stop as soon as topForward+topBackward >= the best path found so far (mu).
+    stats = stats or NO_STATS
+
+    def program(problem):
+      graph = problem.graph
+      goals = problem.goal_states()
+      if f is None or len(goals) != 1:
+        p = lambda s: 0
+      else:
+        p = lambda s: (f(s, goals[0]) - f(problem.initial, s)) / 2
+
+      node = CompactNode(problem.initial)
+      if problem.goal_test(node.state):
+        return node
+
+      forward = {node.state: node}
+      dist_b = {g: 0 for g in goals}
+      next_b = {g: None for g in goals}
+      frontier_f = [(p(node.state), 0, node.state)]
+      frontier_b = [(-p(g), i + 1, g) for i, g in enumerate(goals)]
+      heapq.heapify(frontier_b)
+      done_f, done_b = set(), set()
+      counter = len(goals) + 1
+      mu, meet = math.inf, None
+
+      while frontier_f and frontier_b:
+        if frontier_f[0][0] + frontier_b[0][0] >= mu:
+          break
+        if len(frontier_f) <= len(frontier_b):
+          u = heapq.heappop(frontier_f)[2]
+          if u in done_f:
+            continue
+          done_f.add(u)
+          if stats.enabled:
+            stats.expanded += 1
+          for child in forward[u].expand(problem):
+            v = child.state
+            if stats.enabled:
+              stats.generated += 1
+            if v not in forward or child.path_cost < forward[v].path_cost:
+              if stats.enabled and v in forward:
+                stats.reopened += 1
+              forward[v] = child
+              heapq.heappush(frontier_f, (child.path_cost + p(v), counter, v))
+              counter += 1
+            if v in dist_b and forward[v].path_cost + dist_b[v] < mu:
+              mu, meet = forward[v].path_cost + dist_b[v], v
+        else:
+          u = heapq.heappop(frontier_b)[2]
+          if u in done_b:
+            continue
+          done_b.add(u)
+          if stats.enabled:
+            stats.expanded += 1
+          for (v, dist) in graph.predecessors(u).items():
+            if stats.enabled:
+              stats.generated += 1
+            if v not in dist_b or dist_b[u] + dist < dist_b[v]:
+              if stats.enabled and v in dist_b:
+                stats.reopened += 1
+              dist_b[v] = dist_b[u] + dist
+              next_b[v] = u
+              heapq.heappush(frontier_b, (dist_b[v] - p(v), counter, v))
+              counter += 1
+            if v in forward and forward[v].path_cost + dist_b[v] < mu:
+              mu, meet = forward[v].path_cost + dist_b[v], v
+        if stats.enabled:
+          stats.frontier(len(frontier_f) + len(frontier_b))
+
+      if meet is None:
+        return None
+      #the forward half is a chain of Nodes already; extend it along the backward pointers
+      node, state = forward[meet], meet
+      while next_b[state] is not None:
+        node = node.child_node(problem, action_between(problem, state, next_b[state]))
+        state = next_b[state]
+      return node
+
+    return measured(stats, program)
+
+
+def heuristic_to_goal(f, problem):
+  """Return h(state): f(state, goal), the smallest over the goals if there
+  are several, or 0 when no f is given (as A* does, rounded to 3 digits)."""
+  if f is None:
+    return lambda state: 0
+  goals = problem.goal_states()
+  if len(goals) > 1:
+    return lambda state: min(round(f(state, g), 3) for g in goals)
+  return lambda state: round(f(state, goals[0]), 3)
+
+
+def on_path(node, state):
+  """Return True if state is the state of node or of one of its ancestors."""
+  while node:
+    if node.state == state:
+      return True
+    node = node.parent
+  return False
+
+
+def IDA_StarSearchAgentProgram(f=None, max_expansions=None, stats=None):
+  #Iterative deepening A*: depth-first contours of g+h, memory is only the current path.
+  #Each iteration raises the bound to the smallest g+h that exceeded the previous one.
+  #Only the current path is checked for repeated states, so plateaus of zero-cost edges are slow,
+  #and an unreachable goal takes time exponential in the graph size: max_expansions (counted over
+  #all the iterations) makes it give up and return None.
+  #In the stats the frontier is the depth-first stack and reopened counts the iterations after the first.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      h = heuristic_to_goal(f, problem)
+      expanded = 0
+      root = CompactNode(problem.initial)
+      if problem.goal_test(root.state):
+        return root
+      bound = root.path_cost + h(root.state)
+
+      while True:
+        next_bound = math.inf
+        path_states = {root.state}
+        stack = [(root, iter(root.expand(problem)))]
+        while stack:
+          node, children = stack[-1]
+          child = next(children, None)
+          if child is None:
+            stack.pop()
+            path_states.discard(node.state)
+            continue
+          if stats.enabled:
+            stats.generated += 1
+          if child.state in path_states:
+            continue
+          cost = child.path_cost + h(child.state)
+          if cost > bound:
+            next_bound = min(next_bound, cost)
+            continue
+          if problem.goal_test(child.state):
+            return child
+          if max_expansions is not None and expanded >= max_expansions:
+            return None
+          expanded += 1
+          path_states.add(child.state)
+          stack.append((child, iter(child.expand(problem))))
+          if stats.enabled:
+            stats.expanded += 1
+            stats.frontier(len(stack))
+        if next_bound == math.inf:
+          return None
+        bound = next_bound
+        if stats.enabled:
+          stats.reopened += 1
+
+    return measured(stats, program)
+
+
+def SMA_StarSearchAgentProgram(f=None, memory_limit=10000, stats=None):
+  #Simplified memory-bounded A*: behaves like A* until memory_limit nodes are in memory,
+  #then drops the shallowest of the worst (highest f) leaves and remembers its f in the parent,
+  #so the parent is re-opened and the forgotten subtree regenerated only when it looks best again.
+  #A successor is skipped if a node of the same state with no larger path cost is in memory.
+  #Solutions deeper than memory_limit-1 steps cannot be found, and the search gives up (None) when
+  #the root's f stays the same while twice memory_limit nodes are forgotten without a new
+  #(state, path cost) expanded, as on zero-cost plateaus with an unreachable goal. The guard
+  #remembers at most 4*memory_limit such pairs per root f.
+  #In the stats the frontier is the number of nodes in memory and reopened counts regenerated forgotten nodes.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      h = heuristic_to_goal(f, problem)
+      root = CompactNode(problem.initial)
+      fvalue = {id(root): root.path_cost + h(root.state)}
+      children = {id(root): []}
+      forgotten = {id(root): {}}
+      live = {id(root): root}
+      cheapest = {root.state: root}
+      version = {id(root): 0}
+      counter = 1
+      frontier = [(fvalue[id(root)], 0, 0, 0, root)]
+      leaves = []
+      #termination guard: the (state, path cost) pairs expanded since the root's f last
+      #changed, and the nodes forgotten since the last new one; the pairs count towards
+      #the memory, at most 4*memory_limit of them are kept and after that none is new
+      root_f = fvalue[id(root)]
+      novel = set()
+      stalled = 0
+
+      def push_open(node, key):
+        nonlocal counter
+        version[id(node)] += 1
+        heapq.heappush(frontier, (key, -node.depth, counter, version[id(node)], node))
+        counter += 1
+
+      def push_leaf(node):
+        nonlocal counter
+        heapq.heappush(leaves, (-fvalue[id(node)], node.depth, counter, node))
+        counter += 1
+
+      def backup(node):
+        while node is not None:
+          values = [fvalue[id(c)] for c in children[id(node)]] + list(forgotten[id(node)].values())
+          if not values or min(values) == fvalue[id(node)]:
+            return
+          fvalue[id(node)] = min(values)
+          if not children[id(node)]:
+            push_leaf(node)
+          node = node.parent
+
+      def prune():
+        nonlocal stalled
+        while leaves:
+          negf, _, _, leaf = heapq.heappop(leaves)
+          if id(leaf) not in live or leaf is root or children[id(leaf)] or -negf != fvalue[id(leaf)]:
+            continue
+          parent = leaf.parent
+          children[id(parent)].remove(leaf)
+          forgotten[id(parent)][leaf.state] = fvalue[id(leaf)]
+          for table in (fvalue, children, forgotten, live, version):
+            del table[id(leaf)]
+          if cheapest.get(leaf.state) is leaf:
+            del cheapest[leaf.state]
+          stalled += 1
+          push_open(parent, min(forgotten[id(parent)].values()))
+          if not children[id(parent)]:
+            push_leaf(parent)
+          return
+
+      while frontier:
+        fkey, _, _, ver, node = heapq.heappop(frontier)
+        if id(node) not in live or version[id(node)] != ver:
+          continue
+        if fkey == math.inf:
+          return None
+        if problem.goal_test(node.state):
+          return node
+        if fvalue[id(root)] != root_f:
+          root_f, novel, stalled = fvalue[id(root)], set(), 0
+        if (node.state, node.path_cost) not in novel and len(novel) < 4 * memory_limit:
+          novel.add((node.state, node.path_cost))
+          stalled = 0
+        elif stalled > 2 * memory_limit:
+          #a whole memory was forgotten and regenerated without new work: give up
+          return None
+
+        #(re)generate the successors that are not in memory
+        if stats.enabled:
+          stats.expanded += 1
+        known = {c.state for c in children[id(node)]}
+        new = {}
+        for child in node.expand(problem):
+          if stats.enabled:
+            stats.generated += 1
+          if child.state in known or on_path(node, child.state):
+            continue
+          if child.state in cheapest and cheapest[child.state].path_cost <= child.path_cost:
+            continue
+          if child.state not in new or child.path_cost < new[child.state].path_cost:
+            new[child.state] = child
+        #skipped successors keep their remembered f: their state is in memory elsewhere for now
+        remembered = forgotten[id(node)]
+        forgotten[id(node)] = {s: v for (s, v) in remembered.items() if s not in new and s not in known}
+        for child in new.values():
+          if stats.enabled and child.state in remembered:
+            stats.reopened += 1
+          value = max(fvalue[id(node)], child.path_cost + h(child.state), remembered.get(child.state, 0))
+          if not problem.goal_test(child.state) and child.depth >= memory_limit - 1:
+            value = math.inf
+          fvalue[id(child)] = value
+          children[id(child)] = []
+          forgotten[id(child)] = {}
+          live[id(child)] = child
+          cheapest[child.state] = child
+          version[id(child)] = 0
+          children[id(node)].append(child)
+          push_open(child, value)
+          push_leaf(child)
+        if stats.enabled:
+          stats.frontier(len(live))
+
+        if not children[id(node)] and not forgotten[id(node)]:
+          #dead end: nothing below this node can reach a goal
+          fvalue[id(node)] = math.inf
+          if node is not root:
+            push_leaf(node)
+          backup(node.parent)
+        else:
+          backup(node)
+        while len(live) > memory_limit:
+          prune()
+          if not leaves:
+            break
+      return None
+
+    return measured(stats, program)
+
+
+def ContractionHierarchySearchAgentProgram(hierarchy=None, stats=None):
+  #Answers the queries from a ContractionHierarchy (built or loaded once, see contractionHierarchyClass).
+  #Without a hierarchy it is built from problem.graph on the first call and reused afterwards;
+  #a given hierarchy is taken to be for the graph of the first call. It is built again when a
+  #problem comes with another graph or the graph was changed (graph.version).
+  #The stats have the times of the 'build' and 'query' phases.
+    stats = stats or NO_STATS
+    built_for = None
+
+    def program(problem):
+      nonlocal hierarchy, built_for
+      graph = problem.graph
+      if hierarchy is not None and built_for is None:
+        built_for = (graph, graph.version)
+      if hierarchy is None or built_for[0] is not graph or built_for[1] != graph.version:
+        with stats.phase('build'):
+          hierarchy = ContractionHierarchy(graph)
+        built_for = (graph, graph.version)
+      goals = problem.goal_states()
+      with stats.phase('query'):
+        cost, states = min((hierarchy.query(problem.initial, g) for g in goals), key=lambda r: r[0])
+      return node_from_states(problem, states)
+
+    return measured(stats, program)
+
+
+def HPAStarSearchAgentProgram(hpa=None, cluster_size=10, stats=None):
+  #Hierarchical path-finding over maze clusters (see hpaStarClass): near-optimal paths for long
+  #queries on big maze grids, searching the abstract graph first and then only the chosen corridor.
+  #Without an HPAStar one is built for problem.graph on the first call and reused afterwards;
+  #after changing cells of the maze call hpa.update_cells(cells).
+  #The stats have the times of the 'build' and 'query' phases.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      nonlocal hpa
+      if hpa is None or hpa.graph is not problem.graph:
+        with stats.phase('build'):
+          hpa = HPAStar(problem.graph, cluster_size=cluster_size)
+      goals = problem.goal_states()
+      with stats.phase('query'):
+        cost, states = min((hpa.query(problem.initial, g) for g in goals), key=lambda r: r[0])
+      return node_from_states(problem, states)
+
+    return measured(stats, program)
+
+
+def DistanceMatrixAgentProgram(matrix=None, stats=None):
+  #Looks the legs up in a DistanceMatrix (see distanceMatrixClass), so an agent with many goals
+  #searches once per leg start and every later leg from the same state comes from the cache.
+  #Without a matrix one is made for problem.graph on the first call and reused afterwards.
+  #The stats have the time of the 'lookup' phase.
+    stats = stats or NO_STATS
+
+    def program(problem):
+      nonlocal matrix
+      if matrix is None or matrix.graph is not problem.graph:
+        matrix = DistanceMatrix(problem.graph)
+      goals = problem.goal_states()
+      with stats.phase('lookup'):
+        goal = min(goals, key=lambda g: matrix.distance(problem.initial, g))
+        states = matrix.path(problem.initial, goal)
+      return node_from_states(problem, states)
+
+    return measured(stats, program)
   
  
 # def IDSearchAgentProgram(f=None):
@@ -105,61 +832,65 @@ def BestFirstSearchAgentProgram(f=None):
 
 
 
-def BestFirstSearchAgentProgramForShow(f=None):
+def BestFirstSearchAgentProgramForShow(f=None, stats=None):
   #with BFS we choose a node, n, with minimum value of some evaluation function, f (n).
+  #The color changes are kept in a SearchTrace (see searchTraceClass): allNodeColors[i]
+  #still gives the colors after step i, without a full copy per step.
+    stats = stats or NO_STATS
     
     def program(problem):
       #print(111)
       steps = 0
-      allNodeColors = []
-      nodeColors = {k : 'white' for k in problem.graph.nodes()}
+      allNodeColors = SearchTrace(problem.graph.nodes())
 
       node = Node(problem.initial)
-      nodeColors[node.state] = "yellow"
+      allNodeColors.record(node.state, "yellow")
       steps += 1
-      allNodeColors.append(dict(nodeColors))
 
       #print(node.state)
       frontier = PriorityQueue()
       frontier.put((1,node))
 
-      nodeColors[node.state] = "orange"
+      allNodeColors.record(node.state, "orange")
       steps += 1
-      allNodeColors.append(dict(nodeColors))
 
 
 
       reached = {problem.initial:node}
 
-      while frontier:
+      while not frontier.empty():
         node = frontier.get()[1]
-        nodeColors[node.state] = "red"
+        allNodeColors.record(node.state, "red")
         steps += 1
-        allNodeColors.append(dict(nodeColors))
         #print(node)
 
         if problem.goal_test(node.state):
-          nodeColors[node.state] = "green"
+          allNodeColors.record(node.state, "green")
           steps += 1
-          allNodeColors.append(dict(nodeColors))
           return (node,steps,allNodeColors)
           
 
         #reached.add(node.state)
+        if stats.enabled:
+          stats.expanded += 1
         for child in node.expand(problem):
+            if stats.enabled:
+              stats.generated += 1
             if child.state not in reached or child.path_cost<reached[child.state].path_cost:
+                if stats.enabled and child.state in reached:
+                  stats.reopened += 1
                 frontier.put((1,child))
-                nodeColors[child.state] = "orange"
+                allNodeColors.record(child.state, "orange")
                 steps += 1
-                allNodeColors.append(dict(nodeColors))
 
                 reached.update({child.state:child})
+        if stats.enabled:
+          stats.frontier(frontier.qsize())
 
         # modify the color of explored nodes to blue
-        nodeColors[node.state] = "blue"
+        allNodeColors.record(node.state, "blue")
         steps += 1
-        allNodeColors.append(dict(nodeColors))
             
       return None
 
-    return program
\ No newline at end of file
+    return measured(stats, program)
\ No newline at end of file
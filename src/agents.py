@@ -30,7 +30,7 @@
 
 import math
 
-from src.PS_agentPrograms import A_StarSearchAgentProgram
+from src.PS_agentPrograms import A_StarSearchAgentProgram, DialSearchAgentProgram, DistanceMatrixAgentProgram
 from src.mazeProblemSolvingAgentSMARTClass import MazeProblemSolvingAgentSMART
 #from vacuumProblemSolvingAgentShowClass import VacuumProblemSolvingAgentDraw
 #from src.navProblemSolvingAgentClass import navProblemSolvingAgent
@@ -40,6 +40,13 @@ def ProblemSolvingMazeAgentAstar(initState,mazeWorldGraph,goalState):
     #return MazeProblemSolvingAgentSMART(initState,mazeWorldGraph,goalState,Astar_AP_EvcDist)
     return MazeProblemSolvingAgentSMART(initState,mazeWorldGraph,goalState,A_StarSearchAgentProgram(math.dist))
 
+def ProblemSolvingMazeAgentDial(initState,mazeWorldGraph,goalState):
+    return MazeProblemSolvingAgentSMART(initState,mazeWorldGraph,goalState,DialSearchAgentProgram())
+
+def ProblemSolvingMazeAgentDistanceMatrix(initState,mazeWorldGraph,goalState,matrix=None):
+    #pass one DistanceMatrix to many agents to share the cached searches
+    return MazeProblemSolvingAgentSMART(initState,mazeWorldGraph,goalState,DistanceMatrixAgentProgram(matrix))
+
 
 # def ProblemSolvingMazeAgentBFS(initState,mazeWorldGraph,goalState):
 #     return MazeProblemSolvingAgentSMART(initState,mazeWorldGraph,goalState,BestFirstSearchAgentProgram())
@@ -1,48 +1,68 @@
 from queue import Queue
 
 from src.utils import first
+from src.tracerClass import NO_TRACE
+from src.searchStatsClass import NO_STATS, measured
 
-def AC3(csp):
-  queue = Queue()
+def AC3(csp, tracer=None, stats=None):
+  tracer = tracer or NO_TRACE
+  stats = stats or NO_STATS
+
+  def arc_consistency():
+    queue = Queue()
   
-  print(f"Initial queue:")
-  for Xi in csp.variables:
-    for Xk in csp.neighbors[Xi]:
-      queue.put((Xi, Xk))
-      print((Xi, Xk), end=" ")
-    print()
-   
-  csp.support_pruning()
-  checks = 0
-  while list(queue.queue):
-    (Xi, Xj) = queue.get()
-    #print(f'Arc {(Xi, Xj)} is cheking')
-    revised, checks = revise(csp, Xi, Xj, checks)
-    if revised:
-      if not csp.curr_domains[Xi]:
-        return False, checks  # CSP is inconsistent
+    if tracer.enabled:
+      tracer.emit(f"Initial queue:")
+    for Xi in csp.variables:
       for Xk in csp.neighbors[Xi]:
-        if Xk != Xj:
-          queue.put((Xk, Xi))
-    print(f"Queue: {list(queue.queue)}")
-
-    '''print(f'Arc {(Xj, Xi)} is cheking')
-    revised, checks1 = back_revise(csp, Xi, Xj, checks)
-    if revised:
-      if not csp.curr_domains[Xj]:
-        return False, checks  # CSP is inconsistent
-      for Xk in csp.neighbors[Xj]:
-        if Xk != Xi:
-          queue.add((Xk, Xj))'''
-
-      
-  return True, checks  # CSP is satisfiable
-
-
-def revise(csp, Xi, Xj, checks=0):
+        queue.put((Xi, Xk))
+      if tracer.enabled:
+        tracer.emit(" ".join(str((Xi, Xk)) for Xk in csp.neighbors[Xi]))
+   
+    csp.support_pruning()
+    checks = 0
+    while list(queue.queue):
+      (Xi, Xj) = queue.get()
+      #print(f'Arc {(Xi, Xj)} is cheking')
+      revised, checks = revise(csp, Xi, Xj, checks, tracer, stats)
+      if stats.enabled:
+        stats.expanded += 1
+      if revised:
+        if not csp.curr_domains[Xi]:
+          if stats.enabled:
+            stats.checks = checks
+          return False, checks  # CSP is inconsistent
+        for Xk in csp.neighbors[Xi]:
+          if Xk != Xj:
+            queue.put((Xk, Xi))
+      if tracer.enabled:
+        tracer.emit(f"Queue: {list(queue.queue)}")
+      if stats.enabled:
+        stats.frontier(queue.qsize())
+
+      '''print(f'Arc {(Xj, Xi)} is cheking')
+      revised, checks1 = back_revise(csp, Xi, Xj, checks)
+      if revised:
+        if not csp.curr_domains[Xj]:
+          return False, checks  # CSP is inconsistent
+        for Xk in csp.neighbors[Xj]:
+          if Xk != Xi:
+            queue.add((Xk, Xj))'''
+
+    if stats.enabled:
+      stats.checks = checks
+    return True, checks  # CSP is satisfiable
+
+  return measured(stats, arc_consistency)()
+
+
+def revise(csp, Xi, Xj, checks=0, tracer=None, stats=None):
     """Return true if we remove a value."""
+    tracer = tracer or NO_TRACE
+    stats = stats or NO_STATS
     revised = False
-    print(f'Arc {(Xi, Xj)} is cheking')
+    if tracer.enabled:
+      tracer.emit(f'Arc {(Xi, Xj)} is cheking')
     for x in csp.curr_domains[Xi][:]:
         # If Xi=x conflicts with Xj=y for every possible y, eliminate Xi=x
         # if all(not csp.constraints(Xi, x, Xj, y) for y in csp.curr_domains[Xj]):
@@ -56,13 +76,17 @@ def revise(csp, Xi, Xj, checks=0):
                 break
         if conflict:
             csp.prune(Xi, x)
-            print(f'The val {x} was deleted from {Xi} domain')
+            if tracer.enabled:
+              tracer.emit(f'The val {x} was deleted from {Xi} domain')
+            if stats.enabled:
+              stats.pruned += 1
             revised = True
     return revised, checks
 
 
-def back_revise(csp, Xi, Xj, checks=0):
+def back_revise(csp, Xi, Xj, checks=0, tracer=None):
     """Return true if we remove a value."""
+    tracer = tracer or NO_TRACE
     revised = False
     for x in csp.curr_domains[Xi][:]:
         conflict = False
@@ -77,7 +101,8 @@ def back_revise(csp, Xi, Xj, checks=0):
                 break'''
             if conflict:
               csp.prune(Xj, y)
-              print(f'The val {y} was deleted from {Xj} domain')
+              if tracer.enabled:
+                tracer.emit(f'The val {y} was deleted from {Xj} domain')
               #print(y)
               revised = True
     return revised, checks
@@ -96,24 +121,34 @@ def unordered_domain_values(var, assignment, csp):
     return csp.choices(var)
 
 
-def backtracking_search(csp, select_unassigned_variable=first_unassigned_variable, order_domain_values=unordered_domain_values):
+def backtracking_search(csp, select_unassigned_variable=first_unassigned_variable, order_domain_values=unordered_domain_values, stats=None):
+    stats = stats or NO_STATS
     
     def backtrack(assignment):
         if len(assignment) == len(csp.variables):
             return assignment
 
+        if stats.enabled:
+            stats.expanded += 1
+            stats.frontier(len(assignment))
         var = select_unassigned_variable(assignment, csp)
         for value in order_domain_values(var, assignment, csp):
+            if stats.enabled:
+                stats.checks += 1
             if csp.nconflicts(var, value, assignment)==0:
                 csp.assign(var, value, assignment)
+                if stats.enabled:
+                    stats.assignments += 1
                 result = backtrack(assignment)
                 if result is not None:
                   return result
                 
             csp.unassign(var, assignment)
+        if stats.enabled:
+            stats.backtracks += 1
         return None
 
-    result = backtrack({})
+    result = measured(stats, backtrack)({})
     return result
 
 
@@ -0,0 +1,103 @@
+'''
+Batch experiments: run agent programs on many random mazes in parallel.
+A job is (maze seed, maze size, start, goal, program name). Every worker
+process makes its maze from the seed (makeMaze + defineMazeAvailableActions),
+so only the small job tuple is pickled, and the results are written to a
+CSV file row by row as the episodes finish:
+    jobs = make_jobs(seeds=range(1000), sizes=[20, 50], programs=['dial', 'astar'])
+    run_batch(jobs, 'results.csv', processes=8)
+'''
+import contextlib
+import csv
+import math
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from src.mazeData import makeMaze, defineMazeAvailableActions, makeMazeTransformationModel
+from src.maze2025GraphClass import mazeGraph
+from src.mazeProblemClass import MazeProblem
+from src import PS_agentPrograms
+
+#expansions after which an 'idastar' episode gives up (found is False)
+idastar_budget = 200000
+
+
+def rows_apart(a, b):
+    #admissible for mazeGraph costs: down 1, up 2, left and right 0
+    return max(0, b[0] - a[0]) + 2 * max(0, a[0] - b[0])
+
+
+#program name -> function making the agent program (names are what the jobs carry)
+programs = {
+    'astar': lambda: PS_agentPrograms.A_StarSearchAgentProgram(math.dist),
+    'bestfirst': lambda: PS_agentPrograms.BestFirstSearchAgentProgram(),
+    'dial': lambda: PS_agentPrograms.DialSearchAgentProgram(),
+    'bidirectional': lambda: PS_agentPrograms.BidirectionalSearchAgentProgram(),
+    #IDA* needs a budget: on a maze with the goal walled off it would try every simple path
+    'idastar': lambda: PS_agentPrograms.IDA_StarSearchAgentProgram(rows_apart, max_expansions=idastar_budget),
+    'smastar': lambda: PS_agentPrograms.SMA_StarSearchAgentProgram(),
+    'greedy': lambda: PS_agentPrograms.GreedyBestFirstSearchAgentProgram(math.dist),
+    'beam': lambda: PS_agentPrograms.BeamSearchAgentProgram(math.dist),
+}
+
+fields = ['seed', 'size', 'start', 'goal', 'program', 'found', 'path_cost', 'path_length', 'expansions', 'wall_time']
+
+
+class CountingMazeProblem(MazeProblem):
+    """A MazeProblem that counts how many states were expanded (asked for actions)."""
+
+    def __init__(self, initial, goal, graph):
+        super().__init__(initial, goal, graph)
+        self.expansions = 0
+
+    def actions(self, A):
+        self.expansions += 1
+        return super().actions(A)
+
+
+def make_jobs(seeds, sizes, programs, start=None, goal=None):
+    """All (seed, size, start, goal, program) combinations; start and goal
+    default to the top-left and bottom-right corners."""
+    return [(seed, n, start or (0, 0), goal or (n - 1, n - 1), program)
+            for seed in seeds for n in sizes for program in programs]
+
+
+def make_maze_graph(seed, n):
+    """Make the maze of size n for a seed, the same in every process."""
+    np.random.seed(seed)
+    arrMaze = makeMaze(n)
+    return mazeGraph(makeMazeTransformationModel(defineMazeAvailableActions(arrMaze)))
+
+
+def run_episode(job):
+    """Run one job in this process and return its result row."""
+    seed, n, start, goal, name = job
+    graph = make_maze_graph(seed, n)
+    problem = CountingMazeProblem(tuple(start), tuple(goal), graph)
+    program = programs[name]()
+    begin = time.perf_counter()
+    with open(os.devnull, 'w') as quiet, contextlib.redirect_stdout(quiet):
+        node = program(problem)
+    wall_time = time.perf_counter() - begin
+    return dict(seed=seed, size=n, start=start, goal=goal, program=name,
+                found=node is not None,
+                path_cost=node.path_cost if node is not None else '',
+                path_length=node.depth if node is not None else '',
+                expansions=problem.expansions, wall_time=round(wall_time, 6))
+
+
+def run_batch(jobs, filename, processes=None, chunksize=8):
+    """Run the jobs on a process pool and stream the rows to a CSV file.
+    Return the number of episodes written."""
+    count = 0
+    with open(filename, 'w', newline='') as file, Pool(processes) as pool:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for row in pool.imap_unordered(run_episode, jobs, chunksize):
+            writer.writerow(row)
+            file.flush()
+            count += 1
+    return count
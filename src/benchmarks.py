@@ -0,0 +1,320 @@
+'''
+Benchmarks for the search programs (A_StarSearchAgentProgram,
+BestFirstSearchAgentProgram) and the CSP solvers (backtracking_search, AC3)
+on generated workloads with fixed seeds:
+    random mazes (makeMaze) of several sizes,
+    Romania-style road graphs with more cities,
+    map colouring of random planar maps,
+    Sudoku and Asterisk Sudoku puzzles.
+and the import time of the modules the batch workers load (in a fresh
+interpreter), which must not pull in matplotlib or seaborn.
+Every case reports the wall time (best of repeat runs), the nodes expanded
+(states asked for actions, or CSP assignments), the constraint checks and
+the peak memory (tracemalloc, measured in one extra run).
+The results can be kept as a JSON baseline and later runs compared to it
+(benchmarks.json in the repository root is the committed baseline):
+    results = run_benchmarks()
+    save_baseline(results, 'benchmarks.json')
+    ...
+    for line in compare(run_benchmarks(), load_baseline('benchmarks.json')):
+        print(line)
+or from the command line:
+    python -m src.benchmarks --save benchmarks.json
+    python -m src.benchmarks --compare benchmarks.json
+'''
+import argparse
+import functools
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.mazeData import makeMaze, defineMazeAvailableActions, makeMazeTransformationModel
+from src.maze2025GraphClass import mazeGraph
+from src.graphClass import Graph
+from src.graphProblemClass import GraphProblem
+from src.batchRunner import CountingMazeProblem
+from src.CSPS import MapColoringCSP, SudokuCSP
+from src.algorithms import AC3, backtracking_search
+from src import PS_agentPrograms
+
+
+class CountingGraphProblem(GraphProblem):
+    """A GraphProblem that counts how many states were expanded (asked for actions)."""
+
+    def __init__(self, initial, goal, graph):
+        super().__init__(initial, goal, graph)
+        self.expansions = 0
+
+    def actions(self, A):
+        self.expansions += 1
+        return super().actions(A)
+
+
+def counting_constraints(csp):
+    """Wrap the constraints of csp so that every call is counted; return the counter."""
+    counter = [0]
+    constraints = csp.constraints
+
+    def counted(A, a, B, b):
+        counter[0] += 1
+        return constraints(A, a, B, b)
+
+    csp.constraints = counted
+    return counter
+
+
+# Workload generators
+
+def maze_workload(n, seed):
+    """The maze of size n for a seed, with the corners open; return (graph, start, goal)."""
+    np.random.seed(seed)
+    arrMaze = makeMaze(n)
+    arrMaze[0, 0] = arrMaze[n - 1, n - 1] = 1
+    graph = mazeGraph(makeMazeTransformationModel(defineMazeAvailableActions(arrMaze)))
+    return graph, (0, 0), (n - 1, n - 1)
+
+
+def road_workload(n, seed, k=3, size=1000):
+    """A road map like romaniaData with n cities at random (x, y) points.
+    Every city is linked to the nearest city placed before it (so the map is
+    connected) and to its k nearest cities, with the rounded-up distance as
+    length, so math.dist between the cities is an admissible heuristic.
+    Return (graph, start, goal)."""
+    rng = random.Random(seed)
+    cities = []
+    while len(cities) < n:
+        city = (rng.randrange(size), rng.randrange(size))
+        if city not in cities:
+            cities.append(city)
+    graph = Graph()
+    for (i, a) in enumerate(cities):
+        nearest = sorted(cities, key=lambda b: math.dist(a, b))[1:k + 1]
+        if i > 0:
+            nearest.append(min(cities[:i], key=lambda b: math.dist(a, b)))
+        for b in nearest:
+            length = math.ceil(math.dist(a, b))
+            graph.connect(a, b, length)
+            graph.connect(b, a, length)
+    return graph, cities[0], max(cities, key=lambda b: math.dist(cities[0], b))
+
+
+def planar_map_workload(n, seed, colors='RGBY'):
+    """A map colouring CSP of a random planar map: an n x n grid of regions,
+    each square split by a random diagonal, so every region borders up to 8 others."""
+    rng = random.Random(seed)
+    region = lambda i, j: 'R{}_{}'.format(i, j)
+    neighbors = {region(i, j): [] for i in range(n) for j in range(n)}
+
+    def border(a, b):
+        neighbors[a].append(b)
+        neighbors[b].append(a)
+
+    for i in range(n):
+        for j in range(n):
+            if j + 1 < n:
+                border(region(i, j), region(i, j + 1))
+            if i + 1 < n:
+                border(region(i, j), region(i + 1, j))
+            if i + 1 < n and j + 1 < n:
+                if rng.random() < 0.5:
+                    border(region(i, j), region(i + 1, j + 1))
+                else:
+                    border(region(i, j + 1), region(i + 1, j))
+    return MapColoringCSP(list(colors), neighbors)
+
+
+@functools.lru_cache(maxsize=None)
+def sudoku_workload(seed, blanks=45, asterisk=False):
+    """A Sudoku puzzle: a random full grid (backtracking_search with a seeded
+    random value order) with the given number of cells emptied. Return the grid
+    string; it is made on first use and then kept."""
+    rng = random.Random(seed)
+    csp = SudokuCSP('0' * 81, asterisk)
+    shuffled = lambda var, assignment, csp: rng.sample(csp.choices(var), len(csp.choices(var)))
+    solution = backtracking_search(csp, order_domain_values=shuffled)
+    grid = [str(solution[cell]) for cell in csp.variables]
+    for i in rng.sample(range(81), blanks):
+        grid[i] = '0'
+    return ''.join(grid)
+
+
+# Benchmark cases: name -> make(), where make() builds a fresh instance and
+# returns a function running it that returns (nodes expanded, constraint checks).
+
+def search_case(program, workload):
+    def make():
+        graph, start, goal = workload()
+        counting = CountingMazeProblem if isinstance(graph, mazeGraph) else CountingGraphProblem
+        problem = counting(start, goal, graph)
+
+        def run():
+            program()(problem)
+            return problem.expansions, 0
+        return run
+    return make
+
+
+def backtracking_case(workload, propagate=False):
+    """With propagate=True AC3 first narrows the domains (not measured), as
+    plain backtracking_search only sees the Sudoku clues when it reaches them."""
+    def make():
+        csp = workload()
+        if propagate:
+            AC3(csp)
+        checks = counting_constraints(csp)
+
+        def run():
+            backtracking_search(csp)
+            return csp.nassigns, checks[0]
+        return run
+    return make
+
+
+def ac3_case(workload):
+    def make():
+        csp = workload()
+
+        def run():
+            consistent, checks = AC3(csp)
+            return 0, checks
+        return run
+    return make
+
+
+def make_cases(maze_sizes=(10, 20, 40), road_sizes=(50, 200), map_sizes=(5, 8), seeds=(0, 1)):
+    """Return the dict {name: make} of the benchmark cases. Nothing is generated
+    here: every workload is built by make(), so only the selected cases pay for it."""
+    searches = {
+        'astar': lambda: PS_agentPrograms.A_StarSearchAgentProgram(math.dist),
+        'bestfirst': lambda: PS_agentPrograms.BestFirstSearchAgentProgram(),
+    }
+    cases = {}
+    for seed in seeds:
+        for (name, program) in searches.items():
+            for n in maze_sizes:
+                cases['{}/maze{}/seed{}'.format(name, n, seed)] = search_case(program, lambda n=n, seed=seed: maze_workload(n, seed))
+            for n in road_sizes:
+                cases['{}/roads{}/seed{}'.format(name, n, seed)] = search_case(program, lambda n=n, seed=seed: road_workload(n, seed))
+        for n in map_sizes:
+            workload = lambda n=n, seed=seed: planar_map_workload(n, seed)
+            cases['backtracking/map{}/seed{}'.format(n, seed)] = backtracking_case(workload)
+            cases['ac3/map{}/seed{}'.format(n, seed)] = ac3_case(workload)
+        for asterisk in (False, True):
+            kind = 'asterisk' if asterisk else 'sudoku'
+            workload = lambda seed=seed, asterisk=asterisk: SudokuCSP(sudoku_workload(seed, asterisk=asterisk), asterisk)
+            cases['backtracking/{}/seed{}'.format(kind, seed)] = backtracking_case(workload, propagate=True)
+            cases['ac3/{}/seed{}'.format(kind, seed)] = ac3_case(workload)
+    return cases
+
+
+def measure(make, repeat=3):
+    """Run a case repeat times and once more under tracemalloc; return its result dict."""
+    times = []
+    for _ in range(repeat):
+        run = make()
+        begin = time.perf_counter()
+        expanded, checks = run()
+        times.append(time.perf_counter() - begin)
+    run = make()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return dict(wall_time=round(min(times), 6), expanded=expanded, checks=checks, peak_kib=round(peak / 1024, 1))
+
+
+#modules a headless worker imports, and the plotting packages they must not load
+import_modules = ['src.mazeData', 'src.batchRunner', 'src.PS_agentPrograms']
+heavy_modules = ['matplotlib', 'seaborn']
+
+
+def import_time(module, repeat=3):
+    """Import module in fresh interpreters; return its result dict with the best
+    import time and the heavy modules the import loaded."""
+    code = ('import sys, time; begin = time.perf_counter(); import {}; '
+            'print(time.perf_counter() - begin); print(*[m for m in {!r} if m in sys.modules])').format(module, heavy_modules)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True).stdout.split('\n')
+        times.append(float(out[0]))
+    return dict(wall_time=round(min(times), 6), expanded=0, checks=0, peak_kib=0, heavy=out[1].split())
+
+
+def run_benchmarks(cases=None, repeat=3, only=None, imports=import_modules):
+    """Measure the cases (make_cases() by default) and the import times,
+    or the ones whose name contains only."""
+    cases = cases if cases is not None else make_cases()
+    results = {name: measure(make, repeat) for (name, make) in cases.items() if only is None or only in name}
+    for module in imports:
+        name = 'import/' + module
+        if only is None or only in name:
+            results[name] = import_time(module, repeat)
+    return results
+
+
+def save_baseline(results, filename):
+    with open(filename, 'w') as file:
+        json.dump(dict(python=platform.python_version(), cases=results), file, indent=1, sort_keys=True)
+
+
+def load_baseline(filename):
+    with open(filename) as file:
+        return json.load(file)['cases']
+
+
+def compare(results, baseline, tolerance=0.25, min_time=0.001):
+    """Return a list of regressions of results against baseline: a case that got
+    slower by more than tolerance (and by more than min_time seconds), expanded
+    more nodes or made more constraint checks, or used more than 1 + tolerance
+    times the memory."""
+    regressions = []
+    for (name, now) in sorted(results.items()):
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if now['wall_time'] > before['wall_time'] * (1 + tolerance) and now['wall_time'] - before['wall_time'] > min_time:
+            regressions.append('{}: wall time {} -> {} s'.format(name, before['wall_time'], now['wall_time']))
+        for key in ('expanded', 'checks'):
+            if now[key] > before[key]:
+                regressions.append('{}: {} {} -> {}'.format(name, key, before[key], now[key]))
+        if now['peak_kib'] > before['peak_kib'] * (1 + tolerance):
+            regressions.append('{}: peak memory {} -> {} KiB'.format(name, before['peak_kib'], now['peak_kib']))
+        for module in set(now.get('heavy', [])) - set(before.get('heavy', [])):
+            regressions.append('{}: now imports {}'.format(name, module))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the search programs and CSP solvers.')
+    parser.add_argument('--save', metavar='FILE', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare the results with a JSON baseline')
+    parser.add_argument('--only', help='run only the cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(repeat=args.repeat, only=args.only)
+    for (name, r) in sorted(results.items()):
+        print('{:32} {:>10.6f} s {:>9} expanded {:>10} checks {:>10.1f} KiB {}'.format(
+            name, r['wall_time'], r['expanded'], r['checks'], r['peak_kib'], ' '.join(r.get('heavy', []))).rstrip())
+    if args.save:
+        save_baseline(results, args.save)
+    if args.compare:
+        regressions = compare(results, load_baseline(args.compare), args.tolerance)
+        for line in regressions:
+            print('REGRESSION', line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import heapq
+import math
+import pickle
+
+
+class ContractionHierarchy:
+  '''A contraction hierarchy (CH) is a one-time preprocessing of a Graph
+  for answering many shortest path queries on the same graph.
+  Nodes are contracted one by one (least important first). Contracting v
+  removes it and adds a shortcut u->w of cost c(u,v)+c(v,w) whenever that
+  path is the only shortest way from u to w (no "witness" path exists).
+  A query then only climbs the hierarchy: a forward search from the start
+  and a backward search from the goal, both following edges to higher rank.
+        ch = ContractionHierarchy(Graph(romaniaData))
+        ch.query('Arad', 'Bucharest')  -> (418, ['Arad', 'Sibiu', ...])
+        ch.save('romania.ch'); ch = ContractionHierarchy.load('romania.ch')
+  Works for directed graphs (mazeGraph) as well, edge costs must be >= 0.
+  '''
+
+  def __init__(self, graph=None, witness_limit=500):
+    self.rank = {}
+    self.up_out = {}  # v: {w: cost} for edges v->w with rank[w] > rank[v]
+    self.up_in = {}   # v: {u: cost} for edges u->v with rank[u] > rank[v]
+    self.middle = {}  # (u, w): v for every shortcut u->w added while contracting v
+    self.witness_limit = witness_limit
+    if graph is not None:
+      self.build(graph)
+
+  def build(self, graph):
+    """Order and contract all nodes of graph."""
+    out, inn = {}, {}
+    for v in graph.nodes():
+      out.setdefault(v, {})
+      inn.setdefault(v, {})
+    for a in list(graph.graph_dict.keys()):
+      for (b, dist) in graph.graph_dict[a].items():
+        if a == b:
+          continue
+        out.setdefault(a, {})
+        inn.setdefault(b, {})
+        out.setdefault(b, {})
+        inn.setdefault(a, {})
+        if b not in out[a] or dist < out[a][b]:
+          out[a][b] = dist
+          inn[b][a] = dist
+
+    self.rank, self.up_out, self.up_in, self.middle = {}, {}, {}, {}
+    contracted_neighbors = {v: 0 for v in out}
+    queue = [(self.importance(v, out, inn, contracted_neighbors), i, v) for i, v in enumerate(out)]
+    heapq.heapify(queue)
+    counter = len(queue)
+
+    while queue:
+      _, _, v = heapq.heappop(queue)
+      #lazy update: recompute the importance and postpone v if it got worse
+      priority = self.importance(v, out, inn, contracted_neighbors)
+      if queue and priority > queue[0][0]:
+        heapq.heappush(queue, (priority, counter, v))
+        counter += 1
+        continue
+
+      self.rank[v] = len(self.rank)
+      self.up_out[v] = dict(out[v])
+      self.up_in[v] = dict(inn[v])
+      for (u, w, cost) in self.shortcuts(v, out, inn):
+        out[u][w] = cost
+        inn[w][u] = cost
+        self.middle[(u, w)] = v
+      for w in out[v]:
+        del inn[w][v]
+        contracted_neighbors[w] += 1
+      for u in inn[v]:
+        del out[u][v]
+        contracted_neighbors[u] += 1
+      del out[v], inn[v]
+    return self
+
+  def shortcuts(self, v, out, inn):
+    """Return the (u, w, cost) shortcuts needed if v is contracted now."""
+    needed = []
+    for (u, cost_in) in inn[v].items():
+      targets = {w: cost_in + cost_out for (w, cost_out) in out[v].items() if w != u}
+      if not targets:
+        continue
+      witness = self.witness_search(u, v, max(targets.values()), out)
+      for (w, cost) in targets.items():
+        if witness.get(w, math.inf) > cost:
+          needed.append((u, w, cost))
+    return needed
+
+  def witness_search(self, source, excluded, max_cost, out):
+    """Dijkstra from source over the remaining graph without excluded,
+    up to max_cost or witness_limit settled nodes."""
+    dist = {source: 0}
+    frontier = [(0, 0, source)]
+    counter, settled = 1, 0
+    while frontier and settled < self.witness_limit:
+      d, _, a = heapq.heappop(frontier)
+      if d > dist[a]:
+        continue
+      if d > max_cost:
+        break
+      settled += 1
+      for (b, cost) in out[a].items():
+        if b != excluded and d + cost < dist.get(b, math.inf):
+          dist[b] = d + cost
+          heapq.heappush(frontier, (d + cost, counter, b))
+          counter += 1
+    return dist
+
+  def importance(self, v, out, inn, contracted_neighbors):
+    """Edge difference plus the number of already contracted neighbors."""
+    removed = len(out[v]) + len(inn[v])
+    return len(self.shortcuts(v, out, inn)) - removed + contracted_neighbors[v]
+
+  def query(self, start, goal):
+    """Return (cost, list of states) of a shortest path from start to goal,
+    or (math.inf, None) if goal can't be reached."""
+    if start not in self.rank or goal not in self.rank:
+      return (0, [start]) if start == goal else (math.inf, None)
+    dist = ({start: 0}, {goal: 0})
+    parent = ({start: None}, {goal: None})
+    edges = (self.up_out, self.up_in)
+    frontiers = ([(0, start)], [(0, goal)])
+    best, meet = (0, start) if start == goal else (math.inf, None)
+    side = 0
+    while frontiers[0] or frontiers[1]:
+      if not frontiers[side]:
+        side = 1 - side
+      d, a = heapq.heappop(frontiers[side])
+      if d <= dist[side][a]:
+        if d >= best:
+          frontiers[side].clear()
+        else:
+          for (b, cost) in edges[side][a].items():
+            if d + cost < dist[side].get(b, math.inf):
+              dist[side][b] = d + cost
+              parent[side][b] = a
+              heapq.heappush(frontiers[side], (d + cost, b))
+              if b in dist[1 - side] and d + cost + dist[1 - side][b] < best:
+                best, meet = d + cost + dist[1 - side][b], b
+      side = 1 - side
+    if meet is None:
+      return math.inf, None
+
+    up, down = [], []
+    a = meet
+    while a is not None:
+      up.append(a)
+      a = parent[0][a]
+    a = parent[1][meet]
+    while a is not None:
+      down.append(a)
+      a = parent[1][a]
+    states = list(reversed(up)) + down
+    return best, self.unpack(states)
+
+  def unpack(self, states):
+    """Replace every shortcut in a list of states by the path it stands for."""
+    path = [states[0]]
+    stack = [(a, b) for (a, b) in zip(reversed(states[:-1]), reversed(states[1:]))]
+    while stack:
+      (a, b) = stack.pop()
+      if (a, b) in self.middle:
+        v = self.middle[(a, b)]
+        stack.append((v, b))
+        stack.append((a, v))
+      else:
+        path.append(b)
+    return path
+
+  def save(self, filename):
+    """Write the hierarchy to a file."""
+    with open(filename, 'wb') as file:
+      pickle.dump((self.rank, self.up_out, self.up_in, self.middle), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+  @classmethod
+  def load(cls, filename):
+    """Read a hierarchy written by save."""
+    ch = cls()
+    with open(filename, 'rb') as file:
+      ch.rank, ch.up_out, ch.up_in, ch.middle = pickle.load(file)
+    return ch
@@ -0,0 +1,283 @@
+import json
+import os
+import shutil
+from collections.abc import Mapping
+
+import numpy as np
+
+from src.graphClass import Graph
+from src.maze2025GraphClass import mazeGraph
+from src.mazeData import LEFT, UP, RIGHT, DOWN, actions_dict, mazeBlocks
+
+
+class CSRGraph:
+  '''A read-only Graph or mazeGraph kept as compressed sparse row (CSR)
+  arrays: the links of the state with row i are indices[indptr[i]:indptr[i+1]]
+  (the rows of the target states) with costs[...] (and actions[...] for a maze).
+  The rows are sorted by a key of the state (a non-negative int, an int tuple
+  like the maze cells, or a string), so a state is found by binary search
+  and no dict of the whole graph is ever built.
+  save writes one .npy file per array into a directory and load maps them
+  with numpy.memmap, so loading is nearly free and worker processes that load
+  the same directory share one copy of the graph in the page cache:
+        CSRGraph.from_graph(mazeWorldGraph).save('maze.csr')
+        graph = CSRGraph.load('maze.csr')
+        problem = MazeProblem((0, 0), (999, 999), graph)
+  It has the methods the problems and programs use: get, nodes, predecessors,
+  origin (the {state: {action: state}} view of a maze) and graph_dict.
+  to_graph() turns it back into a Graph / mazeGraph of dicts.
+  For a maze too big for memory, from_maze builds the arrays straight from a
+  (memory-mapped) maze grid, block by block, without any dicts:
+        arrMaze = makeMazeChunked(100000, 'maze.npy')
+        graph = CSRGraph.from_maze(arrMaze, 'maze.csr')
+  Such a grid graph has a row for every cell (row i*n+j for the cell (i, j)),
+  so it needs no key arrays at all.
+  '''
+
+  version = 0
+  arrays = ['keys', 'cells', 'indptr', 'indices', 'costs', 'actions', 'rev_indptr', 'rev_indices', 'rev_costs']
+
+  def __init__(self, meta, **arrays):
+    self.meta = meta
+    self.directed = meta['directed']
+    for name in self.arrays:
+      setattr(self, name, arrays.get(name))
+    self.action_names = meta.get('action_names', [])
+    self.origin = _ActionView(self)
+    self.graph_dict = _LinksView(self)
+    self.locations = None
+
+  @classmethod
+  def from_graph(cls, graph):
+    """Make the CSR arrays of a Graph or mazeGraph."""
+    is_maze = isinstance(graph, mazeGraph)
+    states = set(graph.nodes())
+    if is_maze:
+      states.update(graph.origin.keys())
+      for links in graph.origin.values():
+        states.update(links.values())
+    states = list(states)
+    meta = dict(kind='mazeGraph' if is_maze else 'Graph', directed=graph.directed)
+    meta['state'], meta['dims'], keys, cells = _state_keys(states)
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    cells = cells[order] if cells is not None else None
+    states = [states[i] for i in order]
+    row = {s: i for (i, s) in enumerate(states)}
+
+    action_names = sorted({act for links in graph.origin.values() for act in links}) if is_maze else []
+    action_code = {act: k for (k, act) in enumerate(action_names)}
+    indptr, indices, costs, actions = [0], [], [], []
+    for a in states:
+      links = graph.origin.get(a, {}) if is_maze else graph.get(a)
+      for (act, b) in (links.items() if is_maze else ((None, b) for b in links)):
+        indices.append(row[b])
+        costs.append(graph.get(a, b))
+        actions.append(action_code.get(act, -1))
+      indptr.append(len(indices))
+    meta['action_names'] = action_names
+    cost_type = np.int64 if all(isinstance(c, (int, np.integer)) for c in costs) else np.float64
+    arrays = dict(keys=keys, cells=cells,
+                  indptr=np.array(indptr, dtype=np.int64),
+                  indices=np.array(indices, dtype=np.int64),
+                  costs=np.array(costs, dtype=cost_type))
+    if is_maze:
+      arrays['actions'] = np.array(actions, dtype=np.int8)
+    if graph.directed:
+      arrays['rev_indptr'], arrays['rev_indices'], arrays['rev_costs'] = _reverse(arrays['indptr'], arrays['indices'], arrays['costs'])
+    return cls(meta, **arrays)
+
+  @classmethod
+  def from_maze(cls, arrMaze, dirname, block_rows=1024):
+    """Write the mazeGraph of a maze grid (the moves of defineMazeAvailableActions,
+    costs of mazeGraph) to dirname block by block, with one halo row per side
+    (see mazeBlocks), into memory-mapped .npy files; return the loaded graph."""
+    n, m = arrMaze.shape
+    names = sorted(actions_dict.values())
+    meta = dict(kind='mazeGraph', directed=True, state='tuple', dims=[n, m], grid=True, action_names=names)
+    os.makedirs(dirname, exist_ok=True)
+    with open(os.path.join(dirname, 'meta.json'), 'w') as file:
+      json.dump(meta, file)
+    #per action in the order LEFT, UP, RIGHT, DOWN: row offset of the target and cost, code
+    delta = np.array([-1, -m, 1, m])
+    cost = np.array([0, 2, 0, 1])
+    code = np.array([names.index(actions_dict[a]) for a in (LEFT, UP, RIGHT, DOWN)], dtype=np.int8)
+    #the moves are symmetric, so the links into a cell come from the same neighbours,
+    #taken in row order (above, left, right, below) with the cost of the move back
+    rev_order = [UP, LEFT, RIGHT, DOWN]
+    rev_cost = np.array([1, 0, 0, 2])
+
+    indptr = np.lib.format.open_memmap(os.path.join(dirname, 'indptr.npy'), mode='w+', dtype=np.int64, shape=(n*m + 1,))
+    indptr[0] = 0
+    for (start, stop, moves) in mazeBlocks(arrMaze, block_rows):
+      counts = moves.sum(axis=0).ravel()
+      indptr[start*m + 1:stop*m + 1] = indptr[start*m] + np.cumsum(counts)
+    edges = int(indptr[-1])
+    out = {}
+    for (name, dtype) in (('indices', np.int64), ('costs', np.int64), ('actions', np.int8), ('rev_indices', np.int64), ('rev_costs', np.int64)):
+      out[name] = np.lib.format.open_memmap(os.path.join(dirname, name + '.npy'), mode='w+', dtype=dtype, shape=(edges,))
+    for (start, stop, moves) in mazeBlocks(arrMaze, block_rows):
+      cells = np.arange(start*m, stop*m, dtype=np.int64)[:, None]
+      mask = moves.reshape(4, -1).T
+      (s, e) = indptr[start*m], indptr[stop*m]
+      out['indices'][s:e] = (cells + delta)[mask]
+      out['costs'][s:e] = np.broadcast_to(cost, mask.shape)[mask]
+      out['actions'][s:e] = np.broadcast_to(code, mask.shape)[mask]
+      mask = mask[:, rev_order]
+      out['rev_indices'][s:e] = (cells + delta[rev_order])[mask]
+      out['rev_costs'][s:e] = np.broadcast_to(rev_cost, mask.shape)[mask]
+    for array in list(out.values()) + [indptr]:
+      array.flush()
+    del out, indptr
+    shutil.copyfile(os.path.join(dirname, 'indptr.npy'), os.path.join(dirname, 'rev_indptr.npy'))
+    return cls.load(dirname)
+
+  def save(self, dirname):
+    """Write the graph to a directory of .npy files (and meta.json)."""
+    os.makedirs(dirname, exist_ok=True)
+    with open(os.path.join(dirname, 'meta.json'), 'w') as file:
+      json.dump(self.meta, file)
+    for name in self.arrays:
+      array = getattr(self, name)
+      if array is not None:
+        np.save(os.path.join(dirname, name + '.npy'), array)
+
+  @classmethod
+  def load(cls, dirname, mmap=True):
+    """Read a graph written by save; with mmap the arrays are memory-mapped read-only."""
+    with open(os.path.join(dirname, 'meta.json')) as file:
+      meta = json.load(file)
+    arrays = {}
+    for name in cls.arrays:
+      filename = os.path.join(dirname, name + '.npy')
+      if os.path.exists(filename):
+        arrays[name] = np.load(filename, mmap_mode='r' if mmap else None)
+    return cls(meta, **arrays)
+
+  def __len__(self):
+    if self.meta.get('grid'):
+      return int(np.prod(self.meta['dims']))
+    return len(self.keys)
+
+  def row(self, state):
+    """Return the row of state, or None if it is not in the graph."""
+    kind = self.meta['state']
+    if kind == 'tuple':
+      if not isinstance(state, tuple) or len(state) != len(self.meta['dims']) or any(not 0 <= x < d for (x, d) in zip(state, self.meta['dims'])):
+        return None
+      key = int(np.ravel_multi_index(state, self.meta['dims']))
+      if self.meta.get('grid'):
+        return key
+    else:
+      key = state
+    i = int(np.searchsorted(self.keys, key))
+    if i < len(self.keys) and self.keys[i] == key:
+      return i
+    return None
+
+  def state(self, i):
+    """Return the state of row i."""
+    kind = self.meta['state']
+    if self.meta.get('grid'):
+      return tuple(int(x) for x in np.unravel_index(i, self.meta['dims']))
+    if kind == 'tuple':
+      return tuple(self.cells[i].tolist())
+    if kind == 'int':
+      return int(self.keys[i])
+    return str(self.keys[i])
+
+  def links(self, i, reverse=False):
+    """Return the (rows, costs) of the links out of row i (into row i if reverse)."""
+    if reverse and self.directed:
+      (s, e) = self.rev_indptr[i], self.rev_indptr[i + 1]
+      return self.rev_indices[s:e], self.rev_costs[s:e]
+    (s, e) = self.indptr[i], self.indptr[i + 1]
+    return self.indices[s:e], self.costs[s:e]
+
+  def get(self, a, b=None):
+    """Return a link distance or a dict of {node: distance} entries, as Graph.get."""
+    i = self.row(a)
+    if i is None:
+      return {} if b is None else None
+    rows, costs = self.links(i)
+    links = {self.state(j): c for (j, c) in zip(rows.tolist(), costs.tolist())}
+    if b is None:
+      return links
+    return links.get(b)
+
+  def predecessors(self, b):
+    """Return a dict of {node: distance} entries for the links into b."""
+    i = self.row(b)
+    if i is None:
+      return {}
+    rows, costs = self.links(i, reverse=True)
+    return {self.state(j): c for (j, c) in zip(rows.tolist(), costs.tolist())}
+
+  def nodes(self):
+    return [self.state(i) for i in range(len(self))]
+
+  def to_graph(self):
+    """Return the graph as a Graph or mazeGraph of dicts."""
+    if self.meta['kind'] == 'mazeGraph':
+      return mazeGraph({a: self.origin[a] for a in self.nodes()})
+    graph = Graph()
+    for a in self.nodes():
+      for (b, c) in self.get(a).items():
+        graph.connect(a, b, c)
+    return graph
+
+
+class _ActionView(Mapping):
+  #graph.origin of a CSRGraph: {state: {action: state}} read from the arrays
+
+  def __init__(self, graph):
+    self.graph = graph
+
+  def __getitem__(self, state):
+    g = self.graph
+    i = g.row(state)
+    if i is None:
+      raise KeyError(state)
+    (s, e) = g.indptr[i], g.indptr[i + 1]
+    return {g.action_names[k]: g.state(j) for (k, j) in zip(g.actions[s:e].tolist(), g.indices[s:e].tolist())}
+
+  def __iter__(self):
+    return (self.graph.state(i) for i in range(len(self.graph)))
+
+  def __len__(self):
+    return len(self.graph)
+
+
+class _LinksView(_ActionView):
+  #graph.graph_dict of a CSRGraph: {state: {state: cost}}
+
+  def __getitem__(self, state):
+    if self.graph.row(state) is None:
+      raise KeyError(state)
+    return self.graph.get(state)
+
+
+def _state_keys(states):
+  """Return (kind, dims, sortable keys, cells) for a list of states."""
+  if all(isinstance(s, tuple) for s in states):
+    cells = np.array(states, dtype=np.int64).reshape(len(states), -1)
+    if len(states) and cells.min() < 0:
+      raise ValueError('tuple states must have non-negative ints')
+    dims = [int(d) for d in (cells.max(axis=0) + 1)] if len(states) else []
+    keys = np.ravel_multi_index(cells.T, dims) if len(states) else np.zeros(0, dtype=np.int64)
+    return 'tuple', dims, keys.astype(np.int64), cells
+  if all(isinstance(s, (int, np.integer)) for s in states):
+    return 'int', [], np.array(states, dtype=np.int64), None
+  if all(isinstance(s, str) for s in states):
+    return 'str', [], np.array(states, dtype=str), None
+  raise ValueError('CSRGraph states must be all ints, all int tuples or all strings')
+
+
+def _reverse(indptr, indices, costs):
+  """Return the CSR arrays of the reversed links."""
+  n = len(indptr) - 1
+  sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+  order = np.argsort(indices, kind='stable')
+  rev_indptr = np.zeros(n + 1, dtype=np.int64)
+  np.cumsum(np.bincount(indices, minlength=n), out=rev_indptr[1:])
+  return rev_indptr, sources[order], costs[order]
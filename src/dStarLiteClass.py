@@ -0,0 +1,122 @@
+import heapq
+import math
+from collections import deque
+
+
+class DStarLite:
+  '''D* Lite (Koenig and Likhachev) incremental planner over a Graph or mazeGraph.
+  It searches backward from the goal and keeps g/rhs values between calls,
+  so when edge costs change (a maze cell gets blocked: its incoming edges
+  cost math.inf) only the states whose distance to the goal changed are
+  searched again, instead of a new search from scratch.
+        planner = DStarLite(mazeWorldGraph, (0, 0), (9, 9))
+        planner.plan()                        -> [(0, 0), (0, 1), ..., (9, 9)]
+        mazeWorldGraph.connect((4, 4), (4, 5), math.inf)
+        planner.update_edge((4, 4), (4, 5))
+        planner.move_to((2, 3))
+        planner.plan()                        -> repaired path from (2, 3)
+  f(a, b) is an optional consistent heuristic (0 by default).
+  D* Lite needs positive link costs, but mazeGraph has zero-cost moves,
+  so internally a link costs cost * scale + 1 (scale > number of states):
+  paths are compared by cost first and by number of moves second.
+  '''
+
+  def __init__(self, graph, start, goal, f=None):
+    self.graph = graph
+    self.start = start
+    self.last = start
+    self.goal = goal
+    self.h = f if f is not None else (lambda a, b: 0)
+    self.km = 0
+    self.g = {}
+    self.rhs = {goal: 0}
+    self.queue = []
+    self.queued = {}
+    self.expansions = 0
+    self.scale = len(graph.nodes()) + 1
+    self.push(goal)
+
+  def cost(self, c):
+    return c * self.scale + 1
+
+  def key(self, s):
+    m = min(self.g.get(s, math.inf), self.rhs.get(s, math.inf))
+    return (m + self.cost(self.h(self.start, s)) - 1 + self.km, m)
+
+  def push(self, s):
+    k = self.key(s)
+    self.queued[s] = k
+    heapq.heappush(self.queue, (k, s))
+
+  def top(self):
+    """Drop outdated queue entries; return the smallest valid (key, state) or None."""
+    while self.queue:
+      (k, s) = self.queue[0]
+      if self.queued.get(s) == k:
+        return k, s
+      heapq.heappop(self.queue)
+    return None
+
+  def update_vertex(self, u):
+    if u != self.goal:
+      self.rhs[u] = min([self.cost(c) + self.g.get(s, math.inf) for (s, c) in self.graph.get(u).items()], default=math.inf)
+    self.queued.pop(u, None)
+    if self.g.get(u, math.inf) != self.rhs.get(u, math.inf):
+      self.push(u)
+
+  def compute(self):
+    """Repair g values until the start is consistent (ComputeShortestPath)."""
+    while True:
+      item = self.top()
+      if item is None:
+        return
+      (k_old, u) = item
+      start_key = self.key(self.start)
+      if not (k_old < start_key or self.rhs.get(self.start, math.inf) != self.g.get(self.start, math.inf)):
+        return
+      heapq.heappop(self.queue)
+      del self.queued[u]
+      self.expansions += 1
+      k_new = self.key(u)
+      if k_old < k_new:
+        self.push(u)
+      elif self.g.get(u, math.inf) > self.rhs.get(u, math.inf):
+        self.g[u] = self.rhs[u]
+        for p in list(self.graph.predecessors(u)):
+          self.update_vertex(p)
+      else:
+        self.g[u] = math.inf
+        for p in list(self.graph.predecessors(u)) + [u]:
+          self.update_vertex(p)
+
+  def update_edge(self, u, v):
+    """Call after the cost of the link u -> v changed in the graph."""
+    self.update_vertex(u)
+
+  def move_to(self, state):
+    """The agent moved: make state the new start."""
+    self.km += self.cost(self.h(self.last, state)) - 1
+    self.last = self.start = state
+
+  def plan(self):
+    """Return the list of states of a shortest path from start to goal, or None.
+    The path follows tight links (cost + g(next) == g(state))."""
+    self.compute()
+    if self.g.get(self.start, math.inf) == math.inf:
+      return None
+    parent = {self.start: None}
+    frontier = deque([self.start])
+    while frontier:
+      a = frontier.popleft()
+      if a == self.goal:
+        states = []
+        while a is not None:
+          states.append(a)
+          a = parent[a]
+        return list(reversed(states))
+      ga = self.g.get(a, math.inf)
+      for (b, c) in self.graph.get(a).items():
+        if b not in parent and self.cost(c) + self.g.get(b, math.inf) == ga:
+          parent[b] = a
+          frontier.append(b)
+    return None
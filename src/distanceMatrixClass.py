@@ -0,0 +1,79 @@
+import heapq
+import math
+from collections import OrderedDict
+
+
+class DistanceMatrix:
+  '''Shortest path distances over one Graph (or mazeGraph), computed as
+  one-to-many Dijkstra trees: a single search from a source answers the
+  distance and the path to every target. Trees are cached with LRU
+  eviction under the key (graph.version, source), so a changed graph is
+  searched again and an unchanged one never twice.
+        dm = DistanceMatrix(Graph(romaniaData))
+        dm.distance('Arad', 'Bucharest')   -> 418
+        dm.path('Arad', 'Bucharest')       -> ['Arad', 'Sibiu', ...]
+        dm.matrix(['Arad', 'Iasi'], ['Bucharest', 'Neamt'])
+  '''
+
+  def __init__(self, graph, maxsize=128):
+    self.graph = graph
+    self.maxsize = maxsize
+    self.cache = OrderedDict()
+    self.searches = 0
+
+  def tree(self, source):
+    """Return (dist, parent) dicts of the shortest path tree from source."""
+    key = (self.graph.version, source)
+    if key in self.cache:
+      self.cache.move_to_end(key)
+      return self.cache[key]
+    result = self.dijkstra(source)
+    self.cache[key] = result
+    if len(self.cache) > self.maxsize:
+      self.cache.popitem(last=False)
+    return result
+
+  def dijkstra(self, source):
+    self.searches += 1
+    dist, parent = {source: 0}, {source: None}
+    frontier = [(0, 0, source)]
+    counter = 1
+    while frontier:
+      d, _, a = heapq.heappop(frontier)
+      if d > dist[a]:
+        continue
+      for (b, cost) in list(self.graph.get(a).items()):
+        if d + cost < dist.get(b, math.inf):
+          dist[b] = d + cost
+          parent[b] = a
+          heapq.heappush(frontier, (d + cost, counter, b))
+          counter += 1
+    return dist, parent
+
+  def distance(self, source, target):
+    """Return the shortest path cost from source to target, math.inf if unreachable."""
+    return self.tree(source)[0].get(target, math.inf)
+
+  def path(self, source, target):
+    """Return the list of states on a shortest path from source to target, or None."""
+    dist, parent = self.tree(source)
+    if target not in dist:
+      return None
+    states = []
+    while target is not None:
+      states.append(target)
+      target = parent[target]
+    return list(reversed(states))
+
+  def matrix(self, sources, targets=None):
+    """Return {(source, target): distance} for all pairs, one search per source."""
+    targets = sources if targets is None else targets
+    result = {}
+    for s in sources:
+      dist = self.tree(s)[0]
+      for t in targets:
+        result[(s, t)] = dist.get(t, math.inf)
+    return result
+
+  def clear(self):
+    self.cache.clear()
@@ -6,18 +6,23 @@ Each agent has a .performance slot, initialized to 0.
 '''
 
 #from agentClass import Agent
+from src.tracerClass import NO_TRACE
 
 class Environment:
+  tracer = NO_TRACE #the messages go to self.tracer (see tracerClass)
+
   def __init__(self):
     self.agents = []
 
   def percept(self, agent):
     #Return the percept that the agent sees at this point. (Implement this in derived classes)
-    print("I don't know how to percept.")
+    if self.tracer.enabled:
+      self.tracer.emit("I don't know how to percept.")
 
   def execute_action(self, agent, action):
     #Change the world to reflect this action. (Implement this in derived classes)
-    print("I don't know how to execute_action.")
+    if self.tracer.enabled:
+      self.tracer.emit("I don't know how to execute_action.")
 
   def default_location(self, thing):
     #Default location to place a new thing with unspecified location.
@@ -52,20 +57,23 @@ class Environment:
         for step in range(steps):
             if self.is_done():
                 return
-            print("step {0}:".format(step+1))
+            if self.tracer.enabled:
+              self.tracer.emit("step {0}:".format(step+1))
             self.step()
 
   def add_thing(self, thing, location=None):
     #from agentClass import Agent
     from src.problemSolvingAgentProgramClass import SimpleProblemSolvingAgentProgram
     if thing in self.agents:
-      print("Can't add the same agent twice")
+      if self.tracer.enabled:
+        self.tracer.emit("Can't add the same agent twice")
     else:
       if isinstance(thing, SimpleProblemSolvingAgentProgram):
         thing(thing.state)
         #thing.performance = 0
         #thing.location = location if location is not None else self.default_location(thing)
-        print(f"The Agent in {thing.state} with performance {thing.performance}")
+        if self.tracer.enabled:
+          self.tracer.emit(f"The Agent in {thing.state} with performance {thing.performance}")
         self.agents.append(thing)
         
        
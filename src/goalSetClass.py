@@ -0,0 +1,39 @@
+class GoalSet:
+    """A set of goal states for "reach any of these states" problems.
+    Give it as the goal of a Problem: goal_test becomes one O(1) membership
+    test, and a single search (uniform cost, A*, ...) stops at the nearest goal
+    instead of one search per goal.
+    Non-negative integer states are kept in a boolean array (bytearray),
+    any other hashable states in a frozenset.
+    >>> goals = GoalSet([(3, 4), (7, 0)])
+    >>> (7, 0) in goals
+    True
+    """
+
+    def __init__(self, goals):
+        goals = list(goals)
+        self.size = len(set(goals))
+        if goals and all(isinstance(g, int) and not isinstance(g, bool) and g >= 0 for g in goals):
+            self.flags = bytearray(max(goals) + 1)
+            for g in goals:
+                self.flags[g] = 1
+            self.states = None
+        else:
+            self.flags = None
+            self.states = frozenset(goals)
+
+    def __contains__(self, state):
+        if self.flags is None:
+            return state in self.states
+        return isinstance(state, int) and 0 <= state < len(self.flags) and self.flags[state] == 1
+
+    def __iter__(self):
+        if self.flags is None:
+            return iter(self.states)
+        return (i for (i, flag) in enumerate(self.flags) if flag)
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return "GoalSet({})".format(list(self))
@@ -10,7 +10,13 @@ class Graph:
     You can use g.nodes() to get a list of nodes,
     g.get('A') to get a dict of links out of A, 
     and g.get('A', 'B') to get the length of the link from A to B.
+    g.predecessors('B') returns a dict of links into B (the same as g.get('B')
+    here, but subclasses with one-way links set directed = True).
+    g.version is increased by every connect, so caches can tell a changed graph.
     '''
+    directed = False
+    version = 0
+
     def __init__(self, graph_dict=None):
       self.graph_dict = graph_dict or {}
       self.make_graph()
@@ -24,6 +30,8 @@ class Graph:
     def connect(self, A, B, distance):
         """Add a link from A to B of given distance, in one direction only."""
         self.graph_dict.setdefault(A, {})[B] = distance
+        self.reverse_dict = None
+        self.version += 1
 
     def get(self, a, b=None):
         """Return a link distance or a dict of {node: distance} entries.
@@ -35,6 +43,23 @@ class Graph:
         else:
             return links.get(b)
 
+    def predecessors(self, b):
+        """Return a dict of {node: distance} entries for the links into b.
+        For a directed graph the reverse-adjacency index is built on first
+        use and dropped again by connect."""
+        if not self.directed:
+            return self.get(b)
+        if getattr(self, 'reverse_dict', None) is None:
+            self.make_reverse_graph()
+        return self.reverse_dict.get(b, {})
+
+    def make_reverse_graph(self):
+        """Build the reverse-adjacency index {b: {a: distance}} of the links a -> b."""
+        self.reverse_dict = {}
+        for a in list(self.graph_dict.keys()):
+            for (b, dist) in self.graph_dict[a].items():
+                self.reverse_dict.setdefault(b, {})[a] = dist
+
     def nodes(self):
         """Return a list of nodes in the graph."""
         s1 = set([k for k in self.graph_dict.keys()])
@@ -0,0 +1,235 @@
+import heapq
+import math
+
+
+class HPAStar:
+  '''Hierarchical path-finding A* (HPA*, Botea et al.) over a maze grid
+  (a mazeGraph or CSRGraph of (row, column) cells).
+  The grid is cut into cluster_size x cluster_size clusters. Every run of
+  open cells along the border of two clusters is an entrance, crossed at its
+  middle (and at both ends if it is long). The cells next to the crossings
+  are the abstract nodes; inside a cluster they are linked by the costs of
+  their shortest paths within the cluster (one-way, as mazeGraph costs
+  depend on the direction), and across a border by the crossing link.
+  A query links the start and the goal into their clusters, searches the
+  small abstract graph and then refines only the chosen corridor: every
+  abstract step is a search inside one cluster.
+        hpa = HPAStar(mazeWorldGraph, cluster_size=16)
+        hpa.query((0, 0), (999, 999))   -> (cost, [(0, 0), ..., (999, 999)])
+        mazeWorldGraph.connect((4, 4), (4, 5), math.inf)
+        hpa.update_cells([(4, 4), (4, 5)])   # only the clusters around them
+  The paths are near-optimal, not always the shortest (they pass the
+  entrances where the abstraction put them). f(a, b) is an optional
+  consistent heuristic for the abstract search; links of cost math.inf are
+  treated as walls. The shape (rows, columns) of the grid is taken from the
+  graph (CSRGraph dims, or every cell of graph.origin) unless given.
+  '''
+
+  long_entrance = 6
+
+  def __init__(self, graph, shape=None, cluster_size=10, f=None):
+    self.graph = graph
+    self.shape = tuple(shape) if shape is not None else grid_shape(graph)
+    self.size = cluster_size
+    self.h = f if f is not None else (lambda a, b: 0)
+    self.rows = (self.shape[0] + cluster_size - 1) // cluster_size
+    self.cols = (self.shape[1] + cluster_size - 1) // cluster_size
+    self.crossings = {}  # border: [(a, b, cost)] links from one cluster into the other
+    self.inter = {}      # a: {b: cost} over the borders
+    self.entrances = {}  # cluster: set of abstract nodes in it
+    self.intra = {}      # cluster: {a: {b: cost}} within the cluster
+    self.expansions = 0
+    self.build()
+
+  def cluster(self, cell):
+    return (cell[0] // self.size, cell[1] // self.size)
+
+  def cells_of(self, cluster):
+    (I, J) = cluster
+    return [(i, j) for i in range(I * self.size, min((I + 1) * self.size, self.shape[0]))
+            for j in range(J * self.size, min((J + 1) * self.size, self.shape[1]))]
+
+  def borders_of(self, cluster):
+    """The borders of a cluster, as (cluster, cluster to the right or below) pairs."""
+    (I, J) = cluster
+    borders = []
+    for (A, B) in (((I, J - 1), (I, J)), ((I, J), (I, J + 1)), ((I - 1, J), (I, J)), ((I, J), (I + 1, J))):
+      if 0 <= A[0] and 0 <= A[1] and B[0] < self.rows and B[1] < self.cols:
+        borders.append((A, B))
+    return borders
+
+  def link(self, a, b):
+    cost = self.graph.get(a).get(b)
+    return cost if cost is not None and cost < math.inf else None
+
+  def build(self):
+    """Build the whole abstraction."""
+    clusters = [(I, J) for I in range(self.rows) for J in range(self.cols)]
+    borders = {border for c in clusters for border in self.borders_of(c)}
+    for border in borders:
+      self.build_border(border)
+    for c in clusters:
+      self.build_cluster(c)
+
+  def build_border(self, border):
+    """Find the entrances of a border and their crossing links."""
+    (A, B) = border
+    for (a, b, cost) in self.crossings.get(border, []):
+      self.inter.get(a, {}).pop(b, None)
+    s = self.size
+    if A[0] == B[0]:
+      #B is to the right of A: pairs ((i, j), (i, j+1)) along a column
+      j = B[1] * s - 1
+      pairs = [((i, j), (i, j + 1)) for i in range(A[0] * s, min((A[0] + 1) * s, self.shape[0]))]
+    else:
+      i = B[0] * s - 1
+      pairs = [((i, j), (i + 1, j)) for j in range(A[1] * s, min((A[1] + 1) * s, self.shape[1]))]
+    open_pair = [self.link(a, b) is not None or self.link(b, a) is not None for (a, b) in pairs]
+    chosen = []
+    k = 0
+    while k < len(pairs):
+      if not open_pair[k]:
+        k += 1
+        continue
+      end = k
+      while end + 1 < len(pairs) and open_pair[end + 1]:
+        end += 1
+      if end - k + 1 >= self.long_entrance:
+        chosen += [pairs[k], pairs[end]]
+      else:
+        chosen.append(pairs[(k + end) // 2])
+      k = end + 1
+    links = []
+    for (a, b) in chosen:
+      for (x, y) in ((a, b), (b, a)):
+        cost = self.link(x, y)
+        if cost is not None:
+          links.append((x, y, cost))
+          self.inter.setdefault(x, {})[y] = cost
+    self.crossings[border] = links
+
+  def build_cluster(self, cluster):
+    """Link the abstract nodes of a cluster by their in-cluster path costs."""
+    nodes = set()
+    for border in self.borders_of(cluster):
+      for (a, b, cost) in self.crossings.get(border, []):
+        nodes.update(x for x in (a, b) if self.cluster(x) == cluster)
+    self.entrances[cluster] = nodes
+    self.intra[cluster] = {}
+    for a in nodes:
+      dist, _ = self.search(a, cluster)
+      self.intra[cluster][a] = {b: dist[b] for b in nodes if b != a and b in dist}
+
+  def update_cells(self, cells):
+    """Rebuild the abstraction around changed cells: the borders of their
+    clusters and the clusters on both sides of those borders."""
+    clusters = {self.cluster(c) for c in cells}
+    borders = {border for c in clusters for border in self.borders_of(c)}
+    for border in borders:
+      self.build_border(border)
+    for c in clusters | {c for border in borders for c in border}:
+      self.build_cluster(c)
+
+  def search(self, source, cluster, target=None, reverse=False):
+    """Dijkstra from source over the cells of cluster (against the links if
+    reverse), stopping at target if given. Return (dist, parent)."""
+    dist, parent = {source: 0}, {source: None}
+    frontier = [(0, source)]
+    while frontier:
+      d, a = heapq.heappop(frontier)
+      if d > dist[a]:
+        continue
+      self.expansions += 1
+      if a == target:
+        break
+      links = self.graph.predecessors(a) if reverse else self.graph.get(a)
+      for (b, cost) in links.items():
+        if cost == math.inf or self.cluster(b) != cluster:
+          continue
+        if d + cost < dist.get(b, math.inf):
+          dist[b] = d + cost
+          parent[b] = a
+          heapq.heappush(frontier, (d + cost, b))
+    return dist, parent
+
+  def neighbors(self, a):
+    links = dict(self.intra.get(self.cluster(a), {}).get(a, {}))
+    links.update(self.inter.get(a, {}))
+    return links
+
+  def query(self, start, goal):
+    """Return (cost, list of cells) of a path from start to goal, or (math.inf, None)."""
+    cs, cg = self.cluster(start), self.cluster(goal)
+    if cs not in self.entrances or cg not in self.entrances:
+      return math.inf, None
+    out_start, _ = self.search(start, cs)
+    in_goal, _ = self.search(goal, cg, reverse=True)
+    start_links = {b: out_start[b] for b in self.entrances[cs] if b in out_start and b != start}
+    goal_links = {b: in_goal[b] for b in self.entrances[cg] if b in in_goal}
+    if cs == cg and goal in out_start:
+      start_links[goal] = out_start[goal]
+
+    #Dijkstra (A* with f) over the abstract graph with start and goal linked in
+    dist, parent = {start: 0}, {start: None}
+    frontier = [(self.h(start, goal), 0, start)]
+    while frontier:
+      _, d, a = heapq.heappop(frontier)
+      if d > dist[a]:
+        continue
+      self.expansions += 1
+      if a == goal:
+        break
+      if a == start:
+        links = dict(start_links)
+        links.update(self.inter.get(start, {}))
+      else:
+        links = self.neighbors(a)
+      if a in goal_links and a != goal:
+        links = dict(links)
+        links[goal] = min(goal_links[a], links.get(goal, math.inf))
+      for (b, cost) in links.items():
+        if d + cost < dist.get(b, math.inf):
+          dist[b] = d + cost
+          parent[b] = a
+          heapq.heappush(frontier, (d + cost + self.h(b, goal), d + cost, b))
+    if goal not in dist:
+      return math.inf, None
+    corridor = []
+    a = goal
+    while a is not None:
+      corridor.append(a)
+      a = parent[a]
+    corridor.reverse()
+    return dist[goal], self.refine(corridor)
+
+  def refine(self, corridor):
+    """Turn the abstract path into cells: a step inside one cluster is searched
+    in that cluster, a step over a border is the crossing link itself."""
+    cells = [corridor[0]]
+    for (a, b) in zip(corridor[:-1], corridor[1:]):
+      if a == b:
+        continue
+      cluster = self.cluster(a)
+      if cluster != self.cluster(b):
+        cells.append(b)
+        continue
+      _, parent = self.search(a, cluster, target=b)
+      piece = []
+      while b != a:
+        piece.append(b)
+        b = parent[b]
+      cells.extend(reversed(piece))
+    return cells
+
+
+def grid_shape(graph):
+  """The (rows, columns) of a maze graph: its CSRGraph dims, or one more than
+  the largest row and column among all its cells (graph.origin has the walls
+  and dead ends too, which nodes() leaves out)."""
+  meta = getattr(graph, 'meta', None)
+  if meta is not None and meta.get('dims'):
+    return tuple(meta['dims'])
+  cells = set(getattr(graph, 'origin', None) or graph.nodes())
+  for a in list(cells):
+    cells.update(graph.get(a))
+  return (max(c[0] for c in cells) + 1, max(c[1] for c in cells) + 1)
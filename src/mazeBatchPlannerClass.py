@@ -0,0 +1,85 @@
+import heapq
+import math
+
+from src.PS_agentPrograms import node_from_states
+
+
+class MazeBatchPlanner:
+  '''Plans many maze agents at once. Agents that share a goal get their
+  paths from one reverse Dijkstra tree grown from that goal over
+  mazeGraph.predecessors, so N agents with one goal cost one search
+  instead of N. Goals may also be sets/GoalSets ("reach any"); agents
+  with a list of goals to visit in turn are left to plan by themselves.
+        planner = MazeBatchPlanner(mazeWorldGraph)
+        planner.add_agents(env, agents)  # plans, then env.add_thing(agent)
+  '''
+
+  def __init__(self, graph):
+    self.graph = graph
+    self.searches = 0
+
+  def reverse_tree(self, goals):
+    """Return (dist, nxt): cost to the nearest goal and the next state on the way."""
+    self.searches += 1
+    dist = {g: 0 for g in goals}
+    nxt = {g: None for g in goals}
+    frontier = [(0, i, g) for (i, g) in enumerate(goals)]
+    heapq.heapify(frontier)
+    counter = len(frontier)
+    while frontier:
+      d, _, b = heapq.heappop(frontier)
+      if d > dist[b]:
+        continue
+      for (a, cost) in self.graph.predecessors(b).items():
+        if d + cost < dist.get(a, math.inf):
+          dist[a] = d + cost
+          nxt[a] = b
+          heapq.heappush(frontier, (d + cost, counter, a))
+          counter += 1
+    return dist, nxt
+
+  def group_key(self, goal):
+    if isinstance(goal, list):
+      return None
+    if isinstance(goal, (tuple, str, int)):
+      return goal
+    return frozenset(goal)
+
+  def plan(self, agents):
+    """Set seq (and path) of every agent that shares its goal kind with the batch.
+    Return the agents that could not be planned here."""
+    groups, rest = {}, []
+    for agent in agents:
+      key = self.group_key(agent.goal)
+      if key is None:
+        rest.append(agent)
+      else:
+        groups.setdefault(key, []).append(agent)
+
+    for (key, members) in groups.items():
+      goals = list(key) if isinstance(key, frozenset) else [key]
+      dist, nxt = self.reverse_tree(goals)
+      for agent in members:
+        if agent.state not in dist:
+          agent.seq, agent.path = [], None
+          continue
+        states = [agent.state]
+        while nxt[states[-1]] is not None:
+          states.append(nxt[states[-1]])
+        node = node_from_states(agent.formulate_problem(agent.state, agent.goal), states)
+        agent.seq = node.solution()
+        agent.path = node.path()
+    return rest
+
+  def add_agents(self, env, agents):
+    """Plan the agents in one batch, then put them into the environment.
+    Planned agents with nothing to do (already at the goal, or no path)
+    join the environment as not alive."""
+    rest = self.plan(agents)
+    for agent in agents:
+      if agent not in rest and not agent.seq:
+        agent.alive = False
+        if agent not in env.agents:
+          env.agents.append(agent)
+      else:
+        env.add_thing(agent)
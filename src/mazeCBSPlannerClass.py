@@ -0,0 +1,219 @@
+import heapq
+import math
+import random
+from collections import deque
+
+WAIT = 'wait'
+
+
+class MazeCBSPlanner:
+  '''Collision-free plans for several agents on one mazeGraph, by
+  conflict-based search (CBS).
+  The high level keeps a tree of constraint sets. For a set, every agent
+  is planned alone by a low-level A* over (cell, time) that respects the
+  agent's constraints - a space-time reservation table of forbidden
+  (cell, t) and (cell, next cell, t) moves. The first conflict between two
+  paths (same cell at the same time, or two agents swapping cells) splits
+  the node in two: one agent or the other must avoid it.
+  If CBS does not finish within max_expansions high-level nodes, the agents
+  are planned one after another (prioritized planning), each reserving its
+  path in the space-time reservation table for the next ones; this is not
+  optimal but scales to dozens of agents.
+  The cost is the sum of the agents' arrival times; agents stay on their
+  goal after arriving. A plan is an action list for MazeNavigationEnvironment.step,
+  with WAIT ('wait') for staying in place.
+        cbs = MazeCBSPlanner(mazeWorldGraph)
+        plans = cbs.solve([((0, 0), (9, 9)), ((9, 0), (0, 9))])
+        cbs.add_agents(env, agents)  # sets every agent.seq, then env.add_thing
+  '''
+
+  def __init__(self, graph, max_expansions=1000):
+    self.graph = graph
+    self.max_expansions = max_expansions
+    self.distances = {}
+    self.expansions = 0
+
+  def steps_to(self, goal):
+    """Return {cell: fewest moves from cell to goal} (the low-level heuristic)."""
+    if goal not in self.distances:
+      dist = {goal: 0}
+      queue = deque([goal])
+      while queue:
+        b = queue.popleft()
+        for a in self.graph.predecessors(b):
+          if a not in dist:
+            dist[a] = dist[b] + 1
+            queue.append(a)
+      self.distances[goal] = dist
+    return self.distances[goal]
+
+  def low_level(self, start, goal, constraints, others=(), parked=None):
+    """A* over (cell, time) avoiding constraints, a set of (cell, t) and
+    (cell, next cell, t) entries. Among equally short paths it prefers the one
+    crossing fewest cells of the other agents' paths (conflict avoidance).
+    parked maps cells to the time from which another agent stays there.
+    The path reaches the goal only at its end: MazeNavigationEnvironment
+    stops an agent on its goal, so it cannot pass through it earlier.
+    Return the list of cells per time step, or None."""
+    h = self.steps_to(goal)
+    if start not in h:
+      return None
+    last_on_goal = max([c[1] for c in constraints if len(c) == 2 and c[0] == goal], default=-1)
+    horizon = len(h) + len(constraints) + 1
+    occupied = self.occupancy(others)
+    last = max((len(p) - 1 for p in others), default=0)
+    busy = lambda c, t: occupied.get((c, min(t, last)), 0)
+    parent = {(start, 0): None}
+    frontier = [(h[start], 0, 0, start)]
+    while frontier:
+      _, crossed, t, cell = heapq.heappop(frontier)
+      if cell == goal and t > last_on_goal:
+        cells = []
+        state = (cell, t)
+        while state is not None:
+          cells.append(state[0])
+          state = parent[state]
+        return list(reversed(cells))
+      if t >= horizon:
+        continue
+      for nxt in [cell] + list(self.graph.origin[cell].values()):
+        if nxt not in h or (nxt, t + 1) in parent:
+          continue
+        if (nxt, t + 1) in constraints or (cell, nxt, t + 1) in constraints:
+          continue
+        if nxt == goal and t + 1 <= last_on_goal:
+          continue
+        if parked and parked.get(nxt, math.inf) <= t + 1:
+          continue
+        parent[(nxt, t + 1)] = (cell, t)
+        heapq.heappush(frontier, (t + 1 + h[nxt], crossed + busy(nxt, t + 1), t + 1, nxt))
+    return None
+
+  def occupancy(self, paths):
+    """Return {(cell, t): number of paths in cell at time t}; agents stay on their
+    last cell, which is recorded at the time of the longest path."""
+    last = max((len(p) - 1 for p in paths), default=0)
+    table = {}
+    for path in paths:
+      for t in range(last + 1):
+        key = (path[min(t, len(path) - 1)], t)
+        table[key] = table.get(key, 0) + 1
+    return table
+
+  def count_conflicts(self, paths):
+    """Return the number of (cell, t) collisions among paths."""
+    return sum(n - 1 for n in self.occupancy(paths).values())
+
+  def first_conflict(self, paths):
+    """Return (i, j, constraint for i, constraint for j) of the earliest conflict, or None."""
+    at = lambda path, t: path[min(t, len(path) - 1)]
+    horizon = max(len(p) for p in paths)
+    for t in range(1, horizon):
+      seen = {}
+      for (i, path) in enumerate(paths):
+        cell = at(path, t)
+        if cell in seen:
+          return (seen[cell], i, (cell, t), (cell, t))
+        seen[cell] = i
+      for (i, path) in enumerate(paths):
+        a, b = at(path, t - 1), at(path, t)
+        if a == b:
+          continue
+        j = seen.get(a)
+        if j is not None and j != i and at(paths[j], t - 1) == b:
+          return (i, j, (a, b, t), (b, a, t))
+    return None
+
+  def solve(self, tasks, fallback=True):
+    """tasks is a list of (start, goal). Return one cell list per task,
+    or None if no collision-free plan was found (by CBS within max_expansions,
+    or by prioritized planning if fallback is on)."""
+    starts = [s for (s, g) in tasks]
+    if len(set(starts)) < len(starts):
+      return None
+    constraints = [frozenset() for _ in tasks]
+    paths = []
+    for (s, g) in tasks:
+      paths.append(self.low_level(s, g, frozenset(), paths))
+      if paths[-1] is None:
+        return None
+    counter = 0
+    frontier = [(sum(len(p) - 1 for p in paths), 0, counter, constraints, paths)]
+    self.expansions = 0
+    while frontier and self.expansions < self.max_expansions:
+      cost, _, _, constraints, paths = heapq.heappop(frontier)
+      self.expansions += 1
+      conflict = self.first_conflict(paths)
+      if conflict is None:
+        return paths
+      for (agent, constraint) in ((conflict[0], conflict[2]), (conflict[1], conflict[3])):
+        new_constraints = list(constraints)
+        new_constraints[agent] = constraints[agent] | {constraint}
+        others = paths[:agent] + paths[agent + 1:]
+        path = self.low_level(tasks[agent][0], tasks[agent][1], new_constraints[agent], others)
+        if path is None:
+          continue
+        new_paths = list(paths)
+        new_paths[agent] = path
+        counter += 1
+        conflicts = self.count_conflicts(new_paths)
+        heapq.heappush(frontier, (sum(len(p) - 1 for p in new_paths), conflicts, counter, new_constraints, new_paths))
+    return self.prioritized(tasks) if fallback else None
+
+  def prioritized(self, tasks, restarts=20):
+    """Plan the agents one by one in the reservation table of the ones before,
+    trying the given order first and then shuffled orders."""
+    order = list(range(len(tasks)))
+    shuffle = random.Random(0).shuffle
+    for _ in range(restarts):
+      reserved, parked, paths = set(), {}, [None] * len(tasks)
+      for i in order:
+        (start, goal) = tasks[i]
+        if parked.get(start, math.inf) == 0:
+          break
+        path = self.low_level(start, goal, reserved, parked=parked)
+        if path is None:
+          break
+        paths[i] = path
+        for (t, cell) in enumerate(path):
+          reserved.add((cell, t))
+          if t > 0:
+            reserved.add((cell, path[t - 1], t))
+        parked[path[-1]] = len(path) - 1
+      else:
+        if self.first_conflict(paths) is None:
+          return paths
+      shuffle(order)
+    return None
+
+  def actions(self, cells):
+    """Turn a list of cells (one per time step) into maze actions and WAITs."""
+    acts = []
+    for (a, b) in zip(cells[:-1], cells[1:]):
+      if a == b:
+        acts.append(WAIT)
+      else:
+        acts.append(next(act for (act, c) in self.graph.origin[a].items() if c == b))
+    return acts
+
+  def plan(self, agents):
+    """Set a collision-free seq on every agent (a maze agent with state and a
+    single goal). Return True on success, False if CBS gave up."""
+    paths = self.solve([(agent.state, agent.goal) for agent in agents])
+    if paths is None:
+      return False
+    for (agent, cells) in zip(agents, paths):
+      agent.seq = self.actions(cells)
+    return True
+
+  def add_agents(self, env, agents):
+    """Plan the agents together, then put them into the environment."""
+    if not self.plan(agents):
+      return False
+    for agent in agents:
+      if not agent.seq:
+        agent.alive = False
+        env.agents.append(agent)
+      else:
+        env.add_thing(agent)
+    return True
@@ -2,11 +2,8 @@ import numpy as np
 import math
 import random
 
-
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import seaborn as sns
-from matplotlib.colors import ListedColormap
+#Only the maze data and model are here; the plotting (draw_maze) is in mazeDrawing,
+#so the workers that just make mazes never import matplotlib or seaborn.
 
 LEFT = 0
 UP = 1
@@ -29,25 +26,71 @@ def makeMaze(n):
   return arrMaze
 
 
+def makeMazeBlock(n, seed, block, block_rows=1024):
+  #rows block*block_rows .. of an n x n maze made by makeMazeChunked; every block
+  #has its own random generator (seed, block), so it is the same whatever order
+  #or process makes it
+  start = block*block_rows
+  rows = max(0, min(block_rows, n-start))
+  rng = np.random.default_rng([seed, block])
+  proba_0 =0.2
+  proba_food =0.1
+  return rng.choice(np.array([0, 1, 2], dtype=np.int8), size=(rows, n), p=[proba_0, 1-proba_0-proba_food, proba_food])
+
+
+def makeMazeChunked(n, filename, seed=0, block_rows=1024):
+  #makeMaze for grids bigger than memory: the maze is made block_rows rows at a
+  #time and written into a memory-mapped .npy file (int8), which is returned
+  arrMaze = np.lib.format.open_memmap(filename, mode='w+', dtype=np.int8, shape=(n, n))
+  for block in range((n+block_rows-1)//block_rows):
+    start = block*block_rows
+    arrMaze[start:start+block_rows] = makeMazeBlock(n, seed, block, block_rows)
+    arrMaze.flush()
+  return arrMaze
+
+
+def mazeBlockMoves(arr, start, stop):
+  #the moves allowed from the cells of rows start..stop-1 (as in defineMazeAvailableActions),
+  #read with one halo row above and below: a bool array moves[action, row-start, column]
+  #for the actions LEFT, UP, RIGHT, DOWN (a move needs an open cell and an open target,
+  #also in the bottom-right corner)
+  n, m = arr.shape
+  top = max(start-1, 0)
+  block = np.asarray(arr[top:min(stop+1, n)]) != 0
+  k = start-top #1 if there is a halo row above
+  rows = block[k:k+stop-start]
+  moves = np.zeros((4, stop-start, m), dtype=bool)
+  moves[LEFT, :, 1:] = rows[:, 1:] & rows[:, :-1]
+  moves[RIGHT, :, :-1] = rows[:, :-1] & rows[:, 1:]
+  #block row r+k-1 is above the block row r+k
+  moves[UP, 1-k:] = rows[1-k:] & block[:stop-start-1+k]
+  below = block[k+1:]
+  moves[DOWN, :len(below)] = rows[:len(below)] & below
+  return moves
+
+
+def mazeBlocks(arr, block_rows=1024):
+  #go through a (memory-mapped) maze block by block: yields (start, stop, moves)
+  n = arr.shape[0]
+  for start in range(0, n, block_rows):
+    stop = min(start+block_rows, n)
+    yield start, stop, mazeBlockMoves(arr, start, stop)
+
+
+def saveMaze(filename, arrMaze):
+  #a maze grid is kept as a .npy file
+  np.save(filename, arrMaze)
+
+
+def loadMaze(filename, mmap=True):
+  #with mmap the grid is memory-mapped read-only instead of read into memory
+  return np.load(filename, mmap_mode='r' if mmap else None)
+
+
 def draw_maze(maze):
-    fig, ax = plt.subplots()
-    colors = sns.color_palette('coolwarm', len(np.unique(maze)))
-    #print(colors)
-    cmap = ListedColormap(colors)
-    sns.heatmap(maze, cmap=cmap, annot=False, cbar=False)
-    for i in range(maze.shape[0]):
-      for j in range(maze.shape[1]):
-        rect=patches.Rectangle((j, i), 1, 1, fill=False, edgecolor='yellow', lw=2)
-        ax.add_patch(rect)
-        #plt.gca().add_patch(patches.Rectangle((j, i), 1, 1, fill=False, edgecolor='yellow', lw=2))
-        if i==0 and j==0:
-            rect=patches.Rectangle((j, i), 1, 1, fill=True, color='pink')
-            ax.add_patch(rect)
-        if i==maze.shape[0]-1 and j==maze.shape[1]-1:
-            rect=patches.Rectangle((j, i), 1, 1, fill=True, color='green')
-            ax.add_patch(rect)
-
-    plt.show()
+    #mazeDrawing (with matplotlib and seaborn) is imported on the first drawing
+    from src.mazeDrawing import draw_maze as draw
+    draw(maze)
 
 
 
@@ -0,0 +1,29 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.patches as patches
+import seaborn as sns
+from matplotlib.colors import ListedColormap
+
+#The plotting part of mazeData: only this module needs matplotlib and seaborn.
+#mazeData.draw_maze imports it on the first drawing.
+
+
+def draw_maze(maze):
+    fig, ax = plt.subplots()
+    colors = sns.color_palette('coolwarm', len(np.unique(maze)))
+    #print(colors)
+    cmap = ListedColormap(colors)
+    sns.heatmap(maze, cmap=cmap, annot=False, cbar=False)
+    for i in range(maze.shape[0]):
+      for j in range(maze.shape[1]):
+        rect=patches.Rectangle((j, i), 1, 1, fill=False, edgecolor='yellow', lw=2)
+        ax.add_patch(rect)
+        #plt.gca().add_patch(patches.Rectangle((j, i), 1, 1, fill=False, edgecolor='yellow', lw=2))
+        if i==0 and j==0:
+            rect=patches.Rectangle((j, i), 1, 1, fill=True, color='pink')
+            ax.add_patch(rect)
+        if i==maze.shape[0]-1 and j==maze.shape[1]-1:
+            rect=patches.Rectangle((j, i), 1, 1, fill=True, color='green')
+            ax.add_patch(rect)
+
+    plt.show()
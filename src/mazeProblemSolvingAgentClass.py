@@ -17,7 +17,8 @@ class MazeProblemSolvingAgent(SimpleProblemSolvingAgentProgram):
     if self.goal is not None:
       return self.goal
     else:
-      print("No goal! can't work!")
+      if self.tracer.enabled:
+        self.tracer.emit("No goal! can't work!")
       return None
 
   #a description of the states and actions necessary to reach the goal
@@ -0,0 +1,51 @@
+from src.mazeProblemSolvingAgentSMARTClass import MazeProblemSolvingAgentSMART
+from src.dStarLiteClass import DStarLite
+from src.PS_agentPrograms import node_from_states
+
+class MazeProblemSolvingAgentDStar(MazeProblemSolvingAgentSMART):
+  '''A maze agent that plans with D* Lite and keeps its planner, so when
+  MazeNavigationEnvironment changes link costs (e.g. block_cell) the
+  agent repairs its plan from where it stands instead of searching again
+  from scratch.'''
+
+  def __init__(self, initial_state=None, dataGraph=None, goal=None, f=None):
+    self.planner=None
+    self.f=f
+    super().__init__(initial_state,dataGraph,goal,self.dstar_program)
+
+  def dstar_program(self, problem):
+    if self.planner is None or self.planner.goal!=problem.goal:
+      self.planner=DStarLite(self.dataGraph,problem.initial,problem.goal,self.f)
+    elif self.planner.start!=problem.initial:
+      self.planner.move_to(problem.initial)
+    return node_from_states(problem, self.planner.plan())
+
+  def search(self, problem):
+    node = self.program(problem)
+    if node is None:
+      if self.tracer.enabled:
+        self.tracer.emit("No path from {} to {}".format(problem.initial, problem.goal))
+      self.path=None
+      return []
+    self.path=node.path()
+    return node.solution()
+
+  def update_state(self, state, percept):
+    #the percept is the cell the environment moved the agent to, or an executed action to follow
+    moves=self.dataGraph.origin.get(state, {}) if isinstance(state, tuple) else {}
+    if percept in moves:
+      return moves[percept]
+    return percept
+
+  def edges_changed(self, changes):
+    """The costs of the links (u, v) in changes were changed in dataGraph:
+    repair the planner and replace the rest of the plan. With the goal cut
+    off there is no plan left to follow, so the agent stops."""
+    if self.planner is None:
+      return
+    for (u, v) in changes:
+      self.planner.update_edge(u, v)
+    problem=self.formulate_problem(self.state, self.goal)
+    self.seq=self.search(problem)
+    if not self.seq:
+      self.alive=False
@@ -8,7 +8,8 @@ class MazeProblemSolvingAgentSMART(MazeProblemSolvingAgent):
     self.path=None
 
     if program is None or not isinstance(program, collections.abc.Callable):
-      print("Can't find a valid program for {}, falling back to default.".format(self.__class__.__name__))
+      if self.tracer.enabled:
+        self.tracer.emit("Can't find a valid program for {}, falling back to default.".format(self.__class__.__name__))
 
       def program(percept):
         return eval(input('Percept={}; action? '.format(percept)))
@@ -18,7 +19,8 @@ class MazeProblemSolvingAgentSMART(MazeProblemSolvingAgent):
   def search(self, problem):
     seq = self.program(problem)
     solution=self.actions_path(seq.path()) if seq else None
-    print("Solution (a sequence of actions) from the initial state to a goal: {}".format(solution))
+    if self.tracer.enabled:
+      self.tracer.emit("Solution (a sequence of actions) from the initial state to a goal: {}".format(solution))
     self.path=seq.path()
     return solution
   
@@ -0,0 +1,160 @@
+import math
+
+from src.distanceMatrixClass import DistanceMatrix
+
+
+class MultiGoalPlanner:
+  '''Chooses the order in which an agent with a list of goals visits them.
+  The pairwise distances among the start and the goals come from a
+  DistanceMatrix (one search per start/goal), then the visiting order is
+  the cheapest open path from the start through all goals:
+  exact Held-Karp dynamic programming for up to exact_limit goals,
+  nearest neighbour improved with 2-opt and Or-opt moves for more.
+        planner = MultiGoalPlanner(mazeWorldGraph)
+        planner((0, 0), [(9, 9), (1, 2), (5, 0)])  -> [(1, 2), (5, 0), (9, 9)]
+  Give it to an agent as agent.goal_planner = planner.
+  Goals that cannot be reached from the start are left out of the order and
+  listed in planner.unreachable; if the reachable goals cannot all be
+  visited in one path (one-way links) a ValueError is raised.
+  '''
+
+  def __init__(self, graph, exact_limit=12, matrix=None):
+    self.matrix = matrix or DistanceMatrix(graph)
+    self.exact_limit = exact_limit
+    self.unreachable = []
+
+  def __call__(self, start, goals):
+    """Return the goals in the order to visit them from start."""
+    goals = list(dict.fromkeys(goals))
+    self.unreachable = [g for g in goals if self.matrix.distance(start, g) == math.inf]
+    goals = [g for g in goals if g not in self.unreachable]
+    if len(goals) < 2:
+      return goals
+    points = [start] + goals
+    d = [[self.matrix.distance(a, b) for b in points] for a in points]
+    if len(goals) <= self.exact_limit:
+      order = held_karp(d)
+    else:
+      order = or_opt(d, two_opt(d, nearest_neighbor(d)))
+    return [points[i] for i in order[1:]]
+
+
+def path_cost(d, order):
+  """Cost of the open path visiting the points in order."""
+  return sum(d[a][b] for (a, b) in zip(order[:-1], order[1:]))
+
+
+def check_order(d, order):
+  """Raise ValueError unless order is an open path [0, ...] visiting every
+  point of d once at a finite cost."""
+  if order[:1] != [0] or sorted(order) != list(range(len(d))):
+    raise ValueError('not an order of all the points: {}'.format(order))
+  if path_cost(d, order) == math.inf:
+    raise ValueError('no finite path through all the points in order {}'.format(order))
+
+
+def held_karp(d):
+  """Return the cheapest open path [0, ...] through all the points of the
+  distance matrix d, in O(2^n * n^2). Raise ValueError if every such path
+  has an infinite cost (some point cannot be reached)."""
+  n = len(d) - 1
+  full = (1 << n) - 1
+  cost = [[math.inf] * n for _ in range(full + 1)]
+  back = [[-1] * n for _ in range(full + 1)]
+  for j in range(n):
+    cost[1 << j][j] = d[0][j + 1]
+  for mask in range(1, full + 1):
+    for j in range(n):
+      if not mask & (1 << j) or cost[mask][j] == math.inf:
+        continue
+      for k in range(n):
+        if mask & (1 << k):
+          continue
+        new = cost[mask][j] + d[j + 1][k + 1]
+        if new < cost[mask | (1 << k)][k]:
+          cost[mask | (1 << k)][k] = new
+          back[mask | (1 << k)][k] = j
+  last = min(range(n), key=lambda j: cost[full][j])
+  if cost[full][last] == math.inf:
+    raise ValueError('no finite path through all the points')
+  order, mask = [], full
+  while last != -1:
+    order.append(last + 1)
+    mask, last = mask ^ (1 << last), back[mask][last]
+  order = [0] + list(reversed(order))
+  check_order(d, order)
+  return order
+
+
+def nearest_neighbor(d):
+  """Greedy open path from point 0: always go to the closest unvisited point.
+  Raise ValueError if no unvisited point can be reached."""
+  order = [0]
+  left = set(range(1, len(d)))
+  while left:
+    nxt = min(left, key=lambda j: d[order[-1]][j])
+    if d[order[-1]][nxt] == math.inf:
+      raise ValueError('points {} cannot be reached from {}'.format(sorted(left), order[-1]))
+    order.append(nxt)
+    left.remove(nxt)
+  return order
+
+
+def two_opt(d, order):
+  """Reverse segments of the open path while that makes it cheaper.
+  Works for asymmetric distances (one-way maze costs) as well."""
+  order = list(order)
+  check_order(d, order)
+  n = len(order)
+  improved = True
+  while improved:
+    improved = False
+    for i in range(1, n - 1):
+      forward = backward = 0
+      for j in range(i + 1, n):
+        forward += d[order[j - 1]][order[j]]
+        backward += d[order[j]][order[j - 1]]
+        nxt = order[j + 1] if j + 1 < n else None
+        old = d[order[i - 1]][order[i]] + forward + (d[order[j]][nxt] if nxt is not None else 0)
+        new = d[order[i - 1]][order[j]] + backward + (d[order[i]][nxt] if nxt is not None else 0)
+        if new < old - 1e-9:
+          order[i:j + 1] = reversed(order[i:j + 1])
+          improved = True
+          break
+      if improved:
+        break
+  return order
+
+
+def or_opt(d, order, max_segment=3):
+  """Move segments of up to max_segment points to a cheaper place in the open path."""
+  order = list(order)
+  check_order(d, order)
+  edge = lambda a, b: d[a][b] if b is not None else 0
+  improved = True
+  while improved:
+    improved = False
+    n = len(order)
+    for k in range(1, max_segment + 1):
+      for i in range(1, n - k + 1):
+        first, last = order[i], order[i + k - 1]
+        prev = order[i - 1]
+        nxt = order[i + k] if i + k < n else None
+        gain = d[prev][first] + edge(last, nxt) - edge(prev, nxt)
+        for j in range(n):
+          if i - 1 <= j <= i + k - 1:
+            continue
+          a = order[j]
+          b = order[j + 1] if j + 1 < n else None
+          if d[a][first] + edge(last, b) - edge(a, b) < gain - 1e-9:
+            segment = order[i:i + k]
+            rest = order[:i] + order[i + k:]
+            at = rest.index(a) + 1
+            order = rest[:at] + segment + rest[at:]
+            improved = True
+            break
+        if improved:
+          break
+      if improved:
+        break
+  return order
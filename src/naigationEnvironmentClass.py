@@ -1,10 +1,16 @@
+import math
+from collections import deque
+
 from src.environmentClass import Environment
+from src.mazeCBSPlannerClass import WAIT
 
 
 class MazeNavigationEnvironment(Environment):
-  def __init__(self, navGraph):
+  def __init__(self, navGraph, tracer=None):
     super().__init__()
     self.status = navGraph
+    if tracer is not None:
+      self.tracer = tracer
     
 
   def percept(self, agent):
@@ -17,24 +23,39 @@ class MazeNavigationEnvironment(Environment):
   def update_agent_alive(self, agent):
     if agent.performance <= 0:
       agent.alive = False
-      print("Agent {} is dead.".format(agent))
+      if self.tracer.enabled:
+        self.tracer.emit("Agent {} is dead.".format(agent))
     elif agent.state==agent.goal or len(agent.seq)==0:
       agent.alive = False
-      if len(agent.seq)==0:
-        print("Agent reached all goals")
-      else:
-        print(f"Agent reached the goal: {agent.goal}")
+      if self.tracer.enabled:
+        if len(agent.seq)==0:
+          self.tracer.emit("Agent reached all goals")
+        else:
+          self.tracer.emit(f"Agent reached the goal: {agent.goal}")
       
 
+  def result(self, state, action):
+    '''The state after action: the cell a maze action leads to, the same cell
+    for WAIT, and for other graphs the action itself (the next node).'''
+    if action == WAIT:
+      return state
+    origin = getattr(self.status, 'origin', None)
+    if origin is not None and isinstance(state, tuple):
+      moves = origin.get(state, {})
+      if action in moves:
+        return moves[action]
+    return action
+
   def execute_action(self, agent, action):
     '''Check if agent alive, if so, execute action'''
     if self.is_agent_alive(agent):
         """Change agent's location -> agent's state;
         Track performance.
-        -1 for each move."""
-        agent.state=agent.update_state(agent.state, action)
+        -1 for each move (or wait)."""
+        agent.state=agent.update_state(agent.state, self.result(agent.state, action))
         agent.performance -= 1
-        print(f"Agent in {agent.state} with performance = {agent.performance}")
+        if self.tracer.enabled:
+          self.tracer.emit(f"Agent in {agent.state} with performance = {agent.performance}")
         self.update_agent_alive(agent)
 
         # if action == 'Right':
@@ -55,6 +76,19 @@ class MazeNavigationEnvironment(Environment):
   #       print("Agent is starting in random location...")
   #       return random.choice([loc_A, loc_B])
   
+  def change_edges(self, changes):
+    '''Change link costs of the maze graph, changes is a list of (u, v, cost).
+    Agents that can repair their plans (edges_changed) are told about it.'''
+    for (u, v, cost) in changes:
+      self.status.connect(u, v, cost)
+    for agent in self.agents:
+      if agent.alive and hasattr(agent, 'edges_changed'):
+        agent.edges_changed([(u, v) for (u, v, cost) in changes])
+
+  def block_cell(self, cell):
+    '''Make a maze cell impassable: every link into it costs math.inf.'''
+    self.change_edges([(u, cell, math.inf) for u in list(self.status.predecessors(cell))])
+
   def step(self):
     if not self.is_done():
         actions = []
@@ -62,7 +96,8 @@ class MazeNavigationEnvironment(Environment):
           if agent.alive:
             #with agent.state because for PS Agent we don't need to percive
             action=agent.seq.pop(0)
-            print("Agent decided to do {}.".format(action))
+            if self.tracer.enabled:
+              self.tracer.emit("Agent decided to do {}.".format(action))
             actions.append(action)
           else:
             actions.append("")
@@ -70,5 +105,43 @@ class MazeNavigationEnvironment(Environment):
         for (agent, action) in zip(self.agents, actions):
           self.execute_action(agent, action)
     else:
-        print("There is no one here who could work...")
-    
\ No newline at end of file
+        if self.tracer.enabled:
+          self.tracer.emit("There is no one here who could work...")
+
+  def run_fast(self, steps=10, callback=None):
+    """Run the environment like run/step but without printing, for long
+    simulations with many agents. Plans are consumed from deques, only the
+    agents still alive are visited, and callback(event, step, agent) is
+    called on 'dead' and 'finished' (instead of the prints).
+    The remaining plans are written back to agent.seq at the end.
+    Return a dict of metrics."""
+    plans = {id(agent): deque(agent.seq) for agent in self.agents}
+    active = [agent for agent in self.agents if agent.alive]
+    metrics = {'steps': 0, 'agent_steps': 0, 'dead': 0, 'finished': 0}
+    step = 0
+    while step < steps and active:
+      #every alive agent picks its action before anybody moves, as in step
+      actions = [plans[id(agent)].popleft() for agent in active]
+      still_active = []
+      for (agent, action) in zip(active, actions):
+        agent.state = agent.update_state(agent.state, self.result(agent.state, action))
+        agent.performance -= 1
+        if agent.performance <= 0:
+          agent.alive = False
+          metrics['dead'] += 1
+          if callback:
+            callback('dead', step, agent)
+        elif agent.state == agent.goal or not plans[id(agent)]:
+          agent.alive = False
+          metrics['finished'] += 1
+          if callback:
+            callback('finished', step, agent)
+        else:
+          still_active.append(agent)
+      metrics['agent_steps'] += len(active)
+      active = still_active
+      step += 1
+    metrics['steps'] = step
+    for agent in self.agents:
+      agent.seq = list(plans[id(agent)])
+    return metrics
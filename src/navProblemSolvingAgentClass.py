@@ -10,11 +10,13 @@ class navProblemSolvingAgent(SimpleProblemSolvingAgentProgram):
     self.goal=goal
     
     self.performance=len(dataGraph.nodes())
-    print(self.performance)
+    if self.tracer.enabled:
+      self.tracer.emit(self.performance)
     
 
     if program is None or not isinstance(program, collections.abc.Callable):
-      print("Can't find a valid program for {}, falling back to default.".format(self.__class__.__name__))
+      if self.tracer.enabled:
+        self.tracer.emit("Can't find a valid program for {}, falling back to default.".format(self.__class__.__name__))
 
       def program(percept):
         return eval(input('Percept={}; action? '.format(percept)))
@@ -29,7 +31,8 @@ class navProblemSolvingAgent(SimpleProblemSolvingAgentProgram):
     if self.goal is not None:
       return self.goal
     else:
-      print("No goal! can't work!")
+      if self.tracer.enabled:
+        self.tracer.emit("No goal! can't work!")
       return None
 
   #a description of the states and actions necessary to reach the goal
@@ -41,7 +44,8 @@ class navProblemSolvingAgent(SimpleProblemSolvingAgentProgram):
   def search(self, problem):
     seq = self.program(problem)
     solution=self.actions_path(seq.path())
-    print("Solution (a sequence of actions) from the initial state to a goal: {}".format(solution))
+    if self.tracer.enabled:
+      self.tracer.emit("Solution (a sequence of actions) from the initial state to a goal: {}".format(solution))
     return solution
   
   def actions_path(self, p):
@@ -51,13 +55,17 @@ class navProblemSolvingAgent(SimpleProblemSolvingAgentProgram):
     return acts[1:]
 
   def run(self):
-    print("goal list:", self.goal)
+    if self.tracer.enabled:
+      self.tracer.emit("goal list: {}".format(self.goal))
     if isinstance(self.goal, list) and len(self.goal)>1:
       percept=self.state
-      while len(self.goal)>0:
-        current_goal=self.goal[0]
-        print("current percept:", percept)
-        print("current goal:", current_goal)
+      goals=self.order_goals(self.state, self.goal)
+      if self.tracer.enabled:
+        self.tracer.emit("visiting order: {}".format(goals))
+      for i, current_goal in enumerate(goals):
+        if self.tracer.enabled:
+          self.tracer.emit("current percept: {}".format(percept))
+          self.tracer.emit("current goal: {}".format(current_goal))
         """Formulate a goal and problem, then search for a sequence of actions to solve it."""
         #4-phase problem-solving process
         self.state = self.update_state(self.state, percept)
@@ -65,11 +73,12 @@ class navProblemSolvingAgent(SimpleProblemSolvingAgentProgram):
         problem = self.formulate_problem(self.state, goal)
         self.seq.append (self.search(problem))
         percept=current_goal
-        self.goal.remove(goal)
-        print("goal list:", self.goal)
+        if self.tracer.enabled:
+          self.tracer.emit("goals left: {}".format(goals[i+1:]))
       if not self.seq:
                 return None
       return self.seq
     else:
-      print ("I have the only goal = {}". format(self.goal))
+      if self.tracer.enabled:
+        self.tracer.emit("I have the only goal = {}". format(self.goal))
       return super().__call__(self.state)
@@ -65,3 +65,68 @@ class Node:
 
     def __eq__(self, other):
         return isinstance(other, Node) and self.state == other.state
+
+
+class CompactNode:
+    """A search tree node for big searches: the same interface as Node
+    (state, parent, action, path_cost, depth, path(), solution(), __lt__, __eq__),
+    but stored in __slots__ (no per-instance __dict__), with no visualization
+    color, and expand() is a generator, so the children are made one at a time.
+    Use TracingNode if the search should also keep node colors."""
+
+    __slots__ = ('state', 'parent', 'action', 'path_cost', 'depth')
+    color = "white"
+
+    def __init__(self, state, parent=None, action=None, path_cost=0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        self.depth = parent.depth + 1 if parent else 0
+
+    def __repr__(self):
+        return "<Node {}>".format(self.state)
+
+    def __lt__(self, node):
+        return self.state < node.state
+
+    def __eq__(self, other):
+        #like Node, only nodes of the same kind are compared, so a == b is b == a
+        return isinstance(other, CompactNode) and self.state == other.state
+
+    __hash__ = None
+
+    def expand(self, problem):
+        """Yield the nodes reachable in one step from this node."""
+        for action in problem.actions(self.state):
+            yield self.child_node(problem, action)
+
+    def child_node(self, problem, action):
+        next_state = problem.result(self.state, action)
+        return type(self)(next_state, self, action, problem.path_cost(self.path_cost, self.state, action, next_state))
+
+    def solution(self):
+        """Return the sequence of actions to go from the root to this node."""
+        actions, node = [], self
+        while node.parent is not None:
+            actions.append(node.action)
+            node = node.parent
+        return list(reversed(actions))
+
+    def path(self):
+        """Return a list of nodes forming the path from the root to this node."""
+        node, path_back = self, []
+        while node:
+            path_back.append(node)
+            node = node.parent
+        return list(reversed(path_back))
+
+
+class TracingNode(CompactNode):
+    """A CompactNode that keeps the color for search visualization."""
+
+    __slots__ = ('color',)
+
+    def __init__(self, state, parent=None, action=None, path_cost=0):
+        super().__init__(state, parent, action, path_cost)
+        self.color = "white"
@@ -1,3 +1,6 @@
+from src.goalSetClass import GoalSet
+
+
 class Problem:
     """The abstract class for a formal problem. You should subclass
     this and implement the methods actions and result, and possibly
@@ -35,13 +38,22 @@ class Problem:
     def goal_test(self, state):
         """Return True if the state is a goal. The default method compares the
         state to self.goal or checks for state in self.goal if it is a
-        list, as specified in the constructor. Override this method if
-        checking against a single self.goal is not enough."""
+        list, as specified in the constructor. A set of goals (set, frozenset
+        or GoalSet) is checked with a single O(1) membership test.
+        Override this method if checking against a single self.goal is not enough."""
+        if isinstance(self.goal, (set, frozenset, GoalSet)):
+            return state in self.goal
         if isinstance(self.goal, list):
             return self.goal.count(state)>0
         else:
             return state == self.goal
 
+    def goal_states(self):
+        """Return the goal states as a list (a one-element list for a single goal)."""
+        if isinstance(self.goal, (list, set, frozenset, GoalSet)):
+            return list(self.goal)
+        return [self.goal]
+
     def path_cost(self, c, state1, action, state2):
         """Return the cost of a solution path that arrives at state2 from
         state1 via action, assuming cost c to get up to state1. If the problem
@@ -1,5 +1,10 @@
+from src.tracerClass import NO_TRACE
+
 class SimpleProblemSolvingAgentProgram:
   #Abstract framework for a problem-solving agent
+  goal_planner = None #optional callable(state, goals) -> goals in visiting order, e.g. MultiGoalPlanner
+  tracer = NO_TRACE #the messages go to self.tracer (see tracerClass)
+
   def __init__(self, initial_state=None):
         """State is an abstract representation of the state
         of the world, and seq is the list of actions required
@@ -23,18 +28,16 @@ class SimpleProblemSolvingAgentProgram:
             
             if isinstance(goal, list) and len(goal)>1:
                   percept=self.state                         
-                  while len(self.goal)>0:
+                  for current_goal in self.order_goals(self.state, goal):
                         #4-phase problem-solving process
                         self.state = self.update_state(self.state, percept)
-                        current_goal=self.goal[0]
-                        goal = current_goal
-                        problem = self.formulate_problem(self.state, goal)
+                        problem = self.formulate_problem(self.state, current_goal)
                         self.seq.extend (self.search(problem))
                         percept=current_goal
-                        self.goal.remove(goal)
                   self.state = temp
             else:
-                  print(f"Hi, I have the only goal: {goal}")
+                  if self.tracer.enabled:
+                        self.tracer.emit(f"Hi, I have the only goal: {goal}")
                   problem = self.formulate_problem(self.state, goal)
                   self.seq = self.search(problem)                 
                   
@@ -43,11 +46,19 @@ class SimpleProblemSolvingAgentProgram:
             if not self.seq:
                 return None
         else:
-              print("I have already don my work. Find someone else")
+              if self.tracer.enabled:
+                    self.tracer.emit("I have already don my work. Find someone else")
               
         #return self.seq.pop(0)
         return None
 
+  def order_goals(self, state, goals):
+        """Return the goals in the order they should be visited from state:
+        the goal_planner's order if there is one, otherwise the list order."""
+        if self.goal_planner is not None:
+              return self.goal_planner(state, goals)
+        return list(goals)
+
   def update_state(self, state, percept):
         raise NotImplementedError
 
@@ -0,0 +1,129 @@
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+
+class SearchStats:
+  '''Statistics of one run of a search program or CSP solver. Give one to
+  the program and read it after the call:
+        stats = SearchStats()
+        node = A_StarSearchAgentProgram(math.dist, stats=stats)(problem)
+        stats.expanded, stats.generated, stats.max_frontier, stats.times
+        result = backtracking_search(csp, stats=stats)
+  Search counters: generated (successor nodes made), expanded (nodes taken
+  from the frontier and expanded), reopened (states reached again with a
+  smaller path cost) and max_frontier (the largest frontier size).
+  CSP counters: assignments, backtracks, checks (constraint checks in AC3,
+  consistency tests of a value in backtracking_search) and pruned values;
+  for CSPs expanded counts the search tree nodes (the arcs taken from the
+  queue in AC3) and max_frontier is the deepest assignment (the longest queue).
+  times has the seconds per phase ('total' for the whole call).
+  With profile=True the run is profiled by cProfile (self.profiler, see
+  profile_report), with memory=True its peak memory is taken by tracemalloc.
+  The counters are reset by every run, so a stats object shows the last one.
+  '''
+
+  enabled = True
+
+  def __init__(self, profile=False, memory=False):
+    self.profile = profile
+    self.memory = memory
+    self.reset()
+
+  def reset(self):
+    self.generated = 0
+    self.expanded = 0
+    self.reopened = 0
+    self.max_frontier = 0
+    self.assignments = 0
+    self.backtracks = 0
+    self.checks = 0
+    self.pruned = 0
+    self.times = {}
+    self.profiler = None
+    self.peak_memory = None
+
+  def frontier(self, size):
+    """Note the current frontier size."""
+    if size > self.max_frontier:
+      self.max_frontier = size
+
+  @contextmanager
+  def phase(self, name):
+    """Add the time spent in the with-block to times[name]."""
+    begin = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.times[name] = self.times.get(name, 0) + time.perf_counter() - begin
+
+  def start(self):
+    """Reset the counters and start the clock (and the profiler / tracemalloc)."""
+    self.reset()
+    if self.memory:
+      tracemalloc.start()
+    if self.profile:
+      self.profiler = cProfile.Profile()
+      self.profiler.enable()
+    self.begin = time.perf_counter()
+
+  def stop(self):
+    self.times['total'] = self.times.get('total', 0) + time.perf_counter() - self.begin
+    if self.profiler is not None:
+      self.profiler.disable()
+    if self.memory:
+      self.peak_memory = tracemalloc.get_traced_memory()[1]
+      tracemalloc.stop()
+
+  def profile_report(self, sort='cumulative', limit=20):
+    """Return the profile of the last run as text (the limit top lines by sort)."""
+    if self.profiler is None:
+      return ''
+    out = io.StringIO()
+    pstats.Stats(self.profiler, stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+  def as_dict(self):
+    return dict(generated=self.generated, expanded=self.expanded, reopened=self.reopened,
+                max_frontier=self.max_frontier, assignments=self.assignments,
+                backtracks=self.backtracks, checks=self.checks, pruned=self.pruned,
+                times=dict(self.times), peak_memory=self.peak_memory)
+
+  def __repr__(self):
+    return 'SearchStats({})'.format(', '.join('{}={}'.format(k, v) for (k, v) in self.as_dict().items() if v))
+
+
+class NoStats(SearchStats):
+  """Statistics that are off: the programs skip their counting when stats.enabled is False."""
+
+  enabled = False
+
+  def phase(self, name):
+    return nullcontext()
+
+  def start(self):
+    pass
+
+  def stop(self):
+    pass
+
+
+NO_STATS = NoStats()
+
+
+def measured(stats, search):
+  """Return search itself when stats are off; otherwise a function that runs
+  search between stats.start() and stats.stop()."""
+  if not stats.enabled:
+    return search
+
+  def run(*args, **kwargs):
+    stats.start()
+    try:
+      return search(*args, **kwargs)
+    finally:
+      stats.stop()
+  return run
@@ -0,0 +1,76 @@
+from array import array
+
+
+class SearchTrace:
+  '''A compact record of a search visualization: one (node, color) event per
+  step instead of a full {node: color} copy per step.
+  Events are kept in two integer arrays (node id, color id), and every
+  keyframe_every steps a snapshot of all colors is kept, so the frame of any
+  step is rebuilt from the nearest keyframe with at most keyframe_every events.
+  A SearchTrace can be used like the old list of color dicts:
+        trace = SearchTrace(problem.graph.nodes())
+        trace.record('Arad', 'orange')
+        len(trace)      -> number of steps
+        trace[i]        -> {node: color} after step i (also trace[-1])
+        trace[a:b:c]    -> list of the frames of those steps
+  '''
+
+  def __init__(self, nodes=(), initial='white', keyframe_every=256):
+    self.nodes = []
+    self.node_ids = {}
+    self.colors = [initial]
+    self.color_ids = {initial: 0}
+    self.keyframe_every = keyframe_every
+    self.event_node = array('l')
+    self.event_color = array('h')
+    self.current = array('h')
+    for node in nodes:
+      self.node_id(node)
+    self.keyframes = [array('h', self.current)]
+
+  def node_id(self, node):
+    i = self.node_ids.get(node)
+    if i is None:
+      i = self.node_ids[node] = len(self.nodes)
+      self.nodes.append(node)
+      self.current.append(0)
+    return i
+
+  def record(self, node, color):
+    """Log that node got color in the next step."""
+    i = self.node_id(node)
+    c = self.color_ids.get(color)
+    if c is None:
+      c = self.color_ids[color] = len(self.colors)
+      self.colors.append(color)
+    self.event_node.append(i)
+    self.event_color.append(c)
+    self.current[i] = c
+    if len(self.event_node) % self.keyframe_every == 0:
+      self.keyframes.append(array('h', self.current))
+
+  def frame(self, step):
+    """Return {node: color} after the given step (0 is the first step)."""
+    if step < 0:
+      step += len(self)
+    if not 0 <= step < len(self):
+      raise IndexError('step out of range')
+    k = (step + 1) // self.keyframe_every
+    colors = array('h', self.keyframes[k])
+    colors.extend([0] * (len(self.nodes) - len(colors)))
+    for e in range(k * self.keyframe_every, step + 1):
+      colors[self.event_node[e]] = self.event_color[e]
+    return {node: self.colors[c] for (node, c) in zip(self.nodes, colors)}
+
+  def events(self):
+    """Yield the (step, node, color) events."""
+    for (step, (i, c)) in enumerate(zip(self.event_node, self.event_color)):
+      yield step, self.nodes[i], self.colors[c]
+
+  def __len__(self):
+    return len(self.event_node)
+
+  def __getitem__(self, step):
+    if isinstance(step, slice):
+      return [self.frame(i) for i in range(*step.indices(len(self)))]
+    return self.frame(step)
@@ -0,0 +1,38 @@
+class StateTable:
+  '''Interns search states: every distinct state gets a dense integer id
+  (0, 1, 2, ...) the first time it is seen, so a search can keep its
+  reached/best tables in lists indexed by id instead of dicts keyed by
+  tuples or strings.
+  An id costs one dict lookup, so the table only pays off when a search
+  touches the same state's entries many times (Dial's buckets and best
+  costs); a search that looks each child up once, like A*, is faster with
+  its dict keyed by state. The states here are small tuples and strings
+  whose hashes Python computes quickly (and caches for strings), so there
+  is no incremental (Zobrist) hash for structured states.
+        table = StateTable()
+        table.id_of((0, 0))  -> 0
+        table.id_of((0, 1))  -> 1
+        table.id_of((0, 0))  -> 0
+        table.state_of(1)    -> (0, 1)
+  '''
+
+  def __init__(self):
+    self.ids = {}
+    self.states = []
+
+  def id_of(self, state):
+    """Return the id of state, adding it to the table if it is new."""
+    i = self.ids.get(state)
+    if i is None:
+      i = self.ids[state] = len(self.states)
+      self.states.append(state)
+    return i
+
+  def state_of(self, i):
+    return self.states[i]
+
+  def __contains__(self, state):
+    return state in self.ids
+
+  def __len__(self):
+    return len(self.states)
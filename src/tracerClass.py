@@ -0,0 +1,70 @@
+'''
+Tracers take the teaching output of the search programs, CSP algorithms,
+environments and agents. The default NO_TRACE is off, so the hot loops do
+not even format their messages:
+    if tracer.enabled:
+        tracer.emit("The node {} is extracted from frontier:".format(node.state))
+To see the output again give a StdoutTracer, or collect it with a
+MemoryTracer or FileTracer:
+    A_StarSearchAgentProgram(math.dist, tracer=StdoutTracer())
+    AC3(csp, tracer=MemoryTracer())
+    agent.tracer = StdoutTracer()
+A FileTracer keeps its file open until close(); use it in a with-block:
+    with FileTracer('run.log') as tracer:
+        env = MazeNavigationEnvironment(graph, tracer=tracer)
+        env.run(20)
+'''
+
+
+class Tracer:
+    """The tracer interface; this base class ignores everything."""
+
+    enabled = False
+
+    def emit(self, message):
+        pass
+
+
+class StdoutTracer(Tracer):
+    """Print every message, as the programs used to."""
+
+    enabled = True
+
+    def emit(self, message):
+        print(message)
+
+
+class MemoryTracer(Tracer):
+    """Keep the messages in the list self.messages."""
+
+    enabled = True
+
+    def __init__(self):
+        self.messages = []
+
+    def emit(self, message):
+        self.messages.append(str(message))
+
+
+class FileTracer(Tracer):
+    """Write the messages to a file, one per line."""
+
+    enabled = True
+
+    def __init__(self, filename):
+        self.file = open(filename, 'a')
+
+    def emit(self, message):
+        self.file.write(str(message) + '\n')
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+NO_TRACE = Tracer()
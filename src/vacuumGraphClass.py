@@ -1,6 +1,8 @@
 from src.graphClass import Graph
 
 class vacuumGraph(Graph):
+  directed = True
+
   def __init__(self, graph_dict=None,locations=None):
     #self.g=dict()
     self.origin=graph_dict
@@ -19,6 +21,8 @@ class vacuumGraph(Graph):
   def connect(self, A, B, distance):
     #print(self.g)
     self.graph_dict.setdefault(A, {})[B] = distance
+    self.reverse_dict = None
+    self.version += 1
 
   def nodes(self):
     s1 = set([k for k in self.graph_dict.keys()])
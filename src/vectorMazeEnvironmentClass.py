@@ -0,0 +1,107 @@
+import numpy as np
+
+from src.mazeData import LEFT, UP, RIGHT, DOWN, actions_dict
+
+WAIT = 4
+
+#row/column change of every action code
+MOVES = np.zeros((5, 2), dtype=np.int32)
+MOVES[LEFT] = (0, -1)
+MOVES[UP] = (-1, 0)
+MOVES[RIGHT] = (0, 1)
+MOVES[DOWN] = (1, 0)
+
+action_codes = {name: code for (code, name) in actions_dict.items()}
+action_codes['wait'] = WAIT
+
+
+class VectorMazeEnvironment:
+  '''A maze environment for very many agents, kept as arrays
+  (struct-of-arrays) instead of agent objects: row, col, performance,
+  alive and the goal cell of agent i are row[i], col[i], ... .
+  A whole step is a handful of NumPy operations on the maze grid from
+  makeMaze (0 is a wall): an agent moves if it is alive and the target
+  cell is inside the grid and not a wall, loses 1 performance per step,
+  dies at performance 0 and stops when it is on its goal or out of plan,
+  as in MazeNavigationEnvironment.
+        env = VectorMazeEnvironment(arrMaze)
+        env.add_agents(starts, goals, plans, performance=100)
+        env.run(50)
+  Plans are lists of action names ('left', 'up', 'right', 'down', 'wait')
+  and are stored as a (agents x steps) array of codes.
+  '''
+
+  def __init__(self, maze):
+    self.maze = np.asarray(maze)
+    self.row = np.zeros(0, dtype=np.int32)
+    self.col = np.zeros(0, dtype=np.int32)
+    self.goal_row = np.zeros(0, dtype=np.int32)
+    self.goal_col = np.zeros(0, dtype=np.int32)
+    self.performance = np.zeros(0, dtype=np.int64)
+    self.alive = np.zeros(0, dtype=bool)
+    self.plans = np.zeros((0, 0), dtype=np.int8)
+    self.plan_length = np.zeros(0, dtype=np.int32)
+    self.time = 0
+
+  def add_agents(self, starts, goals, plans, performance=None):
+    """Add agents with start cells, goal cells and plans (lists of action names).
+    performance defaults to the number of cells, as for the maze agents."""
+    k = len(starts)
+    if performance is None:
+      performance = self.maze.size
+    starts, goals = np.asarray(starts, dtype=np.int32).reshape(k, 2), np.asarray(goals, dtype=np.int32).reshape(k, 2)
+    width = max(self.plans.shape[1], max((len(p) for p in plans), default=0) + self.time)
+    new_plans = np.full((k, width), WAIT, dtype=np.int8)
+    for (i, plan) in enumerate(plans):
+      new_plans[i, self.time:self.time + len(plan)] = [action_codes[a] for a in plan]
+    old_plans = np.full((len(self.row), width), WAIT, dtype=np.int8)
+    old_plans[:, :self.plans.shape[1]] = self.plans
+
+    self.row = np.concatenate([self.row, starts[:, 0]])
+    self.col = np.concatenate([self.col, starts[:, 1]])
+    self.goal_row = np.concatenate([self.goal_row, goals[:, 0]])
+    self.goal_col = np.concatenate([self.goal_col, goals[:, 1]])
+    self.performance = np.concatenate([self.performance, np.broadcast_to(np.asarray(performance, dtype=np.int64), (k,))])
+    self.alive = np.concatenate([self.alive, np.array([len(p) > 0 for p in plans], dtype=bool)])
+    self.plans = np.concatenate([old_plans, new_plans])
+    self.plan_length = np.concatenate([self.plan_length, np.array([self.time + len(p) for p in plans], dtype=np.int32)])
+
+  def add_maze_agents(self, agents, performance=None):
+    """Add planned maze agents (state, goal and seq) as array rows."""
+    self.add_agents([a.state for a in agents], [a.goal for a in agents], [a.seq for a in agents],
+                    performance if performance is not None else [a.performance for a in agents])
+
+  def step(self, actions=None):
+    """Move all alive agents one step, by actions (codes, one per agent) or by their plans."""
+    if actions is None:
+      if self.time >= self.plans.shape[1]:
+        actions = np.full(len(self.row), WAIT, dtype=np.int8)
+      else:
+        actions = self.plans[:, self.time]
+    n, m = self.maze.shape
+    new_row = self.row + MOVES[actions, 0]
+    new_col = self.col + MOVES[actions, 1]
+    inside = (new_row >= 0) & (new_row < n) & (new_col >= 0) & (new_col < m)
+    open_cell = np.zeros(len(self.row), dtype=bool)
+    open_cell[inside] = self.maze[new_row[inside], new_col[inside]] != 0
+    move = self.alive & inside & open_cell
+    self.row = np.where(move, new_row, self.row)
+    self.col = np.where(move, new_col, self.col)
+
+    self.performance[self.alive] -= 1
+    self.time += 1
+    dead = self.alive & (self.performance <= 0)
+    done = self.alive & ~dead & (((self.row == self.goal_row) & (self.col == self.goal_col)) | (self.plan_length <= self.time))
+    self.alive &= ~(dead | done)
+    return int(dead.sum()), int(done.sum())
+
+  def is_done(self):
+    return not self.alive.any()
+
+  def run(self, steps=10):
+    """Run for the given number of steps or until no agent is alive; return the steps made."""
+    for step in range(steps):
+      if self.is_done():
+        return step
+      self.step()
+    return steps
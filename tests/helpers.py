@@ -0,0 +1,85 @@
+import heapq
+import math
+import random
+
+import numpy as np
+
+from src.mazeData import makeMaze, defineMazeAvailableActions, makeMazeTransformationModel, mazeStatesLocations
+from src.maze2025GraphClass import mazeGraph
+from src.graphClass import Graph
+from src.mazeProblemSolvingAgentClass import MazeProblemSolvingAgent
+from data.RomaniaMapData import romaniaData, romaniaLocations
+
+
+def ucs_cost(graph, start, goal):
+  """Reference uniform-cost search: the cheapest path cost from start to goal, or math.inf."""
+  dist = {start: 0}
+  frontier = [(0, 0, start)]
+  counter = 1
+  while frontier:
+    d, _, a = heapq.heappop(frontier)
+    if a == goal:
+      return d
+    if d > dist[a]:
+      continue
+    for (b, cost) in graph.get(a).items():
+      if d + cost < dist.get(b, math.inf):
+        dist[b] = d + cost
+        heapq.heappush(frontier, (d + cost, counter, b))
+        counter += 1
+  return math.inf
+
+
+def maze(n, seed, open_corners=True):
+  """The random maze of size n for seed; return (arrMaze, mazeGraph)."""
+  np.random.seed(seed)
+  arrMaze = makeMaze(n)
+  if open_corners:
+    arrMaze[0, 0] = arrMaze[n - 1, n - 1] = 1
+  states = makeMazeTransformationModel(defineMazeAvailableActions(arrMaze))
+  return arrMaze, mazeGraph(states, mazeStatesLocations(list(states.keys())))
+
+
+def maze_queries(n=12, seeds=range(4), count=15):
+  """(graph, start, goal) queries between random cells of random mazes,
+  walls and unreachable goals included."""
+  rng = random.Random(n)
+  cells = [(i, j) for i in range(n) for j in range(n)]
+  queries = []
+  for seed in seeds:
+    arrMaze, graph = maze(n, seed)
+    queries += [(graph, rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+  return queries
+
+
+def romania():
+  graph = Graph(dict((a, dict(links)) for (a, links) in romaniaData.items()))
+  graph.locations = romaniaLocations
+  return graph
+
+
+def make_agents(graph, tasks):
+  """Maze agents for the (start, goal) tasks, with enough performance to live through a run."""
+  agents = [MazeProblemSolvingAgent(start, graph, goal) for (start, goal) in tasks]
+  for agent in agents:
+    agent.performance = 100
+  return agents
+
+
+def node_cost(node):
+  """The path cost of a search result, math.inf when the search found nothing."""
+  return node.path_cost if node is not None else math.inf
+
+
+def states_cost(graph, states):
+  """The cost of walking the list of states, math.inf for no plan."""
+  return sum(graph.get(a, b) for (a, b) in zip(states[:-1], states[1:])) if states else math.inf
+
+
+def straight_line(a, b):
+  return math.dist(romaniaLocations[a], romaniaLocations[b])
+
+
+def rows_apart(a, b):
+  #admissible for mazeGraph costs: down 1, up 2, left and right 0
+  return max(0, b[0] - a[0]) + 2 * max(0, a[0] - b[0])
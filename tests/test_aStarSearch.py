@@ -0,0 +1,34 @@
+import random
+
+from src.goalSetClass import GoalSet
+from src.graphProblemClass import GraphProblem
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import A_StarSearchAgentProgram
+
+from helpers import ucs_cost, maze, romania, node_cost, straight_line, rows_apart
+
+
+def test_romania_costs_match_ucs():
+  graph = romania()
+  for goal in graph.nodes():
+    node = A_StarSearchAgentProgram(straight_line)(GraphProblem('Arad', goal, graph))
+    assert node.path_cost == ucs_cost(graph, 'Arad', goal)
+
+
+def test_default_heuristic_with_a_goal_set():
+  arrMaze, graph = maze(10, 3)
+  goals = GoalSet([(9, 9), (0, 9), (5, 5)])
+  node = A_StarSearchAgentProgram()(MazeProblem((0, 0), goals, graph))
+  assert node.state in goals
+
+
+def test_goal_set_costs_match_ucs():
+  rng = random.Random(0)
+  for seed in range(5):
+    arrMaze, graph = maze(12, seed)
+    cells = [(i, j) for i in range(12) for j in range(12)]
+    for _ in range(10):
+      start, goals = rng.choice(cells), GoalSet(rng.sample(cells, 3))
+      best = min(ucs_cost(graph, start, g) for g in goals)
+      node = A_StarSearchAgentProgram(rows_apart)(MazeProblem(start, goals, graph))
+      assert node_cost(node) == best
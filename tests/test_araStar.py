@@ -0,0 +1,34 @@
+from src.graphProblemClass import GraphProblem
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import ARA_StarSearchAgentProgram, anytime_best
+from src.searchStatsClass import SearchStats
+
+from helpers import ucs_cost, maze, maze_queries, romania, node_cost, straight_line, rows_apart
+
+
+def test_romania_last_solution_is_optimal():
+  graph = romania()
+  program = ARA_StarSearchAgentProgram(straight_line, w=3)
+  for goal in graph.nodes():
+    costs = [node.path_cost for node in program(GraphProblem('Arad', goal, graph))]
+    assert costs[-1] == ucs_cost(graph, 'Arad', goal)
+    assert all(a > b for (a, b) in zip(costs[:-1], costs[1:]))
+
+
+def test_maze_last_solution_matches_ucs():
+  program = ARA_StarSearchAgentProgram(rows_apart)
+  for (graph, start, goal) in maze_queries():
+    assert node_cost(anytime_best(program(MazeProblem(start, goal, graph)))) == ucs_cost(graph, start, goal)
+
+
+def test_expansion_budget_stops_early_with_valid_solutions():
+  arrMaze, graph = maze(20, 0)
+  problem = lambda: MazeProblem((0, 0), (19, 19), graph)
+  best = ucs_cost(graph, (0, 0), (19, 19))
+  stats = SearchStats()
+  full = [node.path_cost for node in ARA_StarSearchAgentProgram(rows_apart, stats=stats)(problem())]
+  assert full[-1] == best
+  for budget in range(1, stats.expanded, max(1, stats.expanded // 10)):
+    costs = [node.path_cost for node in ARA_StarSearchAgentProgram(rows_apart, max_expansions=budget)(problem())]
+    assert all(cost >= best for cost in costs)
+    assert all(a > b for (a, b) in zip(costs[:-1], costs[1:]))
@@ -0,0 +1,26 @@
+import csv
+
+from src.batchRunner import fields, make_jobs, run_batch, run_episode
+
+
+def test_rows_are_written_to_the_csv(tmp_path):
+  #seed 0 walls the goal off, so IDA* has to give up at its budget
+  jobs = make_jobs(seeds=[0, 1], sizes=[8], programs=['dial', 'idastar', 'astar'])
+  filename = tmp_path / 'results.csv'
+  assert run_batch(jobs, filename, processes=1) == len(jobs)
+  with open(filename, newline='') as file:
+    reader = csv.DictReader(file)
+    assert reader.fieldnames == fields
+    rows = {(row['seed'], row['program']): row for row in reader}
+  assert sorted(rows) == sorted((str(seed), program) for (seed, n, start, goal, program) in jobs)
+  for seed in ('0', '1'):
+    dial, idastar = rows[(seed, 'dial')], rows[(seed, 'idastar')]
+    assert dial['found'] == idastar['found'] == rows[(seed, 'astar')]['found']
+    assert dial['path_cost'] == idastar['path_cost']
+  assert rows[('0', 'dial')]['found'] == 'False' and rows[('1', 'dial')]['found'] == 'True'
+
+
+def test_episode_row():
+  row = run_episode((1, 8, (0, 0), (7, 7), 'idastar'))
+  assert sorted(row) == sorted(fields)
+  assert row['found'] and row['path_cost'] == 7 and row['expansions'] > 0
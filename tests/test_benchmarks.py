@@ -0,0 +1,18 @@
+import os
+
+from src import benchmarks
+
+BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks.json')
+
+
+def test_cases_are_built_lazily():
+  benchmarks.sudoku_workload.cache_clear()
+  cases = benchmarks.make_cases()
+  assert 'backtracking/sudoku/seed0' in cases
+  assert benchmarks.sudoku_workload.cache_info().currsize == 0
+
+
+def test_counters_match_the_committed_baseline():
+  results = benchmarks.run_benchmarks(repeat=1, only='map5', imports=[])
+  assert sorted(results) == ['ac3/map5/seed0', 'ac3/map5/seed1', 'backtracking/map5/seed0', 'backtracking/map5/seed1']
+  assert benchmarks.compare(results, benchmarks.load_baseline(BASELINE), tolerance=100) == []
@@ -0,0 +1,22 @@
+from src.graphProblemClass import GraphProblem
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import BidirectionalSearchAgentProgram
+
+from helpers import ucs_cost, maze_queries, romania, node_cost
+
+
+def test_romania_costs_match_ucs():
+  graph = romania()
+  program = BidirectionalSearchAgentProgram()
+  for start in ('Arad', 'Neamt'):
+    for goal in graph.nodes():
+      assert node_cost(program(GraphProblem(start, goal, graph))) == ucs_cost(graph, start, goal)
+
+
+def test_maze_costs_match_ucs():
+  program = BidirectionalSearchAgentProgram()
+  for (graph, start, goal) in maze_queries():
+    node = program(MazeProblem(start, goal, graph))
+    assert node_cost(node) == ucs_cost(graph, start, goal)
+    if node is not None:
+      assert node.path()[0].state == start and node.state == goal
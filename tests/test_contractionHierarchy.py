@@ -0,0 +1,45 @@
+import math
+
+from src.contractionHierarchyClass import ContractionHierarchy
+from src.graphProblemClass import GraphProblem
+from src.PS_agentPrograms import ContractionHierarchySearchAgentProgram
+
+from helpers import ucs_cost, maze_queries, romania, node_cost
+
+
+def test_romania_costs_match_ucs():
+  graph = romania()
+  program = ContractionHierarchySearchAgentProgram()
+  for start in ('Arad', 'Neamt'):
+    for goal in graph.nodes():
+      assert node_cost(program(GraphProblem(start, goal, graph))) == ucs_cost(graph, start, goal)
+
+
+def test_program_rebuilds_for_a_changed_or_other_graph():
+  graph = romania()
+  program = ContractionHierarchySearchAgentProgram()
+  assert program(GraphProblem('Arad', 'Bucharest', graph)).path_cost == 418
+  graph.connect('Arad', 'Bucharest', 100)
+  assert program(GraphProblem('Arad', 'Bucharest', graph)).path_cost == 100
+  other = romania()
+  assert program(GraphProblem('Arad', 'Bucharest', other)).path_cost == ucs_cost(other, 'Arad', 'Bucharest') == 418
+
+
+def test_maze_costs_and_paths_match_ucs():
+  hierarchies = {}
+  for (graph, start, goal) in maze_queries():
+    hierarchy = hierarchies.setdefault(id(graph), ContractionHierarchy(graph))
+    cost, states = hierarchy.query(start, goal)
+    assert cost == ucs_cost(graph, start, goal)
+    if cost < math.inf:
+      assert states[0] == start and states[-1] == goal
+      assert sum(graph.get(a, b) for (a, b) in zip(states[:-1], states[1:])) == cost
+
+
+def test_saved_hierarchy_answers_the_same(tmp_path):
+  graph = romania()
+  hierarchy = ContractionHierarchy(graph)
+  hierarchy.save(tmp_path / 'romania.ch')
+  loaded = ContractionHierarchy.load(tmp_path / 'romania.ch')
+  for goal in graph.nodes():
+    assert loaded.query('Arad', goal) == hierarchy.query('Arad', goal)
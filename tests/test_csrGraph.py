@@ -0,0 +1,52 @@
+import numpy as np
+
+from src.csrGraphClass import CSRGraph
+from src.mazeData import makeMazeBlock, makeMazeChunked, loadMaze, saveMaze
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import DialSearchAgentProgram
+
+from helpers import ucs_cost, maze, romania, node_cost
+
+
+def same_links(graph, csr, states):
+  return all(csr.get(a) == graph.get(a) and csr.predecessors(a) == graph.predecessors(a) for a in states)
+
+
+def test_romania_round_trip(tmp_path):
+  graph = romania()
+  csr = CSRGraph.from_graph(graph)
+  assert same_links(graph, csr, graph.nodes())
+  csr.save(tmp_path / 'romania')
+  assert same_links(graph, CSRGraph.load(tmp_path / 'romania'), graph.nodes())
+
+
+def test_maze_round_trip_and_search(tmp_path):
+  arrMaze, graph = maze(12, 5)
+  csr = CSRGraph.from_graph(graph)
+  cells = [(i, j) for i in range(12) for j in range(12)]
+  assert same_links(graph, csr, cells)
+  csr.save(tmp_path / 'maze')
+  loaded = CSRGraph.load(tmp_path / 'maze', mmap=True)
+  assert {a: dict(loaded.origin[a]) for a in graph.origin} == graph.origin
+  program = DialSearchAgentProgram()
+  for goal in cells[::7]:
+    node = program(MazeProblem((0, 0), goal, loaded))
+    assert node_cost(node) == ucs_cost(graph, (0, 0), goal)
+
+
+def test_from_maze_matches_from_graph(tmp_path):
+  arrMaze, graph = maze(13, 6)
+  expected = CSRGraph.from_graph(graph)
+  #defineMazeAvailableActions leaves the bottom-right corner without moves
+  cells = [(i, j) for i in range(13) for j in range(13) if (i, j) != (12, 12)]
+  for block_rows in (1, 4, 13):
+    csr = CSRGraph.from_maze(arrMaze, tmp_path / 'grid{}'.format(block_rows), block_rows)
+    assert all(csr.get(a) == expected.get(a) for a in cells)
+
+
+def test_chunked_maze_is_the_same_for_any_block_order(tmp_path):
+  arrMaze = makeMazeChunked(10, tmp_path / 'maze.npy', seed=3, block_rows=4)
+  blocks = [makeMazeBlock(10, 3, block, 4) for block in (2, 0, 1)]
+  assert np.array_equal(arrMaze, np.vstack([blocks[1], blocks[2], blocks[0]]))
+  saveMaze(tmp_path / 'copy.npy', arrMaze)
+  assert np.array_equal(loadMaze(tmp_path / 'copy.npy'), arrMaze)
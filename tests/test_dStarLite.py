@@ -0,0 +1,56 @@
+import math
+import random
+
+from src.dStarLiteClass import DStarLite
+from src.mazeProblemSolvingAgentDStarClass import MazeProblemSolvingAgentDStar
+from src.naigationEnvironmentClass import MazeNavigationEnvironment
+
+from helpers import ucs_cost, maze, maze_queries, states_cost
+
+
+def test_plans_match_ucs():
+  for (graph, start, goal) in maze_queries():
+    assert states_cost(graph, DStarLite(graph, start, goal).plan()) == ucs_cost(graph, start, goal)
+
+
+def test_repaired_plans_match_a_fresh_ucs():
+  rng = random.Random(1)
+  for seed in range(4):
+    arrMaze, graph = maze(12, seed)
+    planner = DStarLite(graph, (0, 0), (11, 11))
+    states = planner.plan()
+    for _ in range(4):
+      assert states_cost(graph, states) == ucs_cost(graph, planner.start, (11, 11))
+      if states is None or len(states) < 3:
+        break
+      #walk one step, then block a cell further on the path
+      planner.move_to(states[1])
+      cell = rng.choice(states[2:-1] or states[2:])
+      if cell == (11, 11):
+        break
+      for a in list(graph.predecessors(cell)):
+        graph.connect(a, cell, math.inf)
+        planner.update_edge(a, cell)
+      states = planner.plan()
+
+
+def test_agent_repairs_its_plan_when_the_environment_blocks_a_cell():
+  for seed in range(6):
+    arrMaze, graph = maze(12, seed)
+    agent = MazeProblemSolvingAgentDStar((0, 0), graph, (11, 11))
+    agent(agent.state)
+    if agent.path is None or len(agent.path) < 6:
+      continue
+    blocked = agent.path[4].state
+    env = MazeNavigationEnvironment(graph)
+    env.add_thing(agent)
+    env.step()
+    env.step()
+    env.block_cell(blocked)
+    here = agent.state
+    reachable = ucs_cost(graph, here, (11, 11)) < math.inf
+    assert agent.alive == reachable
+    while not env.is_done():
+      env.step()
+      assert agent.state != blocked
+    assert agent.state == ((11, 11) if reachable else here)
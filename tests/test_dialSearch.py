@@ -0,0 +1,46 @@
+import random
+
+import numpy as np
+
+from src.graphClass import Graph
+from src.graphProblemClass import GraphProblem
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import DialSearchAgentProgram, small_integer_edge_costs
+
+from helpers import ucs_cost, maze, romania, node_cost
+
+
+def test_romania_costs_match_ucs():
+  graph = romania()
+  program = DialSearchAgentProgram()
+  for goal in graph.nodes():
+    assert program(GraphProblem('Arad', goal, graph)).path_cost == ucs_cost(graph, 'Arad', goal)
+
+
+def test_maze_costs_match_ucs():
+  rng = random.Random(0)
+  program = DialSearchAgentProgram()
+  for seed in range(5):
+    arrMaze, graph = maze(15, seed)
+    cells = [(i, j) for i in range(15) for j in range(15)]
+    for _ in range(20):
+      start, goal = rng.choice(cells), rng.choice(cells)
+      node = program(MazeProblem(start, goal, graph))
+      assert node_cost(node) == ucs_cost(graph, start, goal)
+
+
+def test_cost_bound_follows_graph_version():
+  graph = Graph({'A': {'B': 1}, 'B': {'C': 2}})
+  assert small_integer_edge_costs(graph) == 2
+  assert small_integer_edge_costs(graph, max_cost=1) is None
+  graph.connect('C', 'D', 7)
+  assert small_integer_edge_costs(graph) == 7
+  graph.connect('D', 'E', 2.5)
+  assert small_integer_edge_costs(graph) is None
+
+
+def test_numpy_integer_costs_use_the_buckets():
+  graph = Graph({'A': {'B': np.int64(1), 'C': np.int32(4)}, 'B': {'C': np.uint8(2)}})
+  bound = small_integer_edge_costs(graph)
+  assert bound == 4 and type(bound) is int
+  assert DialSearchAgentProgram()(GraphProblem('A', 'C', graph)).path_cost == 3
@@ -0,0 +1,35 @@
+import math
+
+from src.distanceMatrixClass import DistanceMatrix
+from src.goalSetClass import GoalSet
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import DistanceMatrixAgentProgram
+
+from helpers import ucs_cost, maze, maze_queries, romania, node_cost
+
+
+def test_romania_distances_match_ucs():
+  graph = romania()
+  dm = DistanceMatrix(graph)
+  cities = graph.nodes()
+  for ((a, b), d) in dm.matrix(cities).items():
+    assert d == ucs_cost(graph, a, b)
+  assert dm.searches == len(cities)
+
+
+def test_maze_costs_match_ucs():
+  program = DistanceMatrixAgentProgram()
+  for (graph, start, goal) in maze_queries():
+    assert node_cost(program(MazeProblem(start, goal, graph))) == ucs_cost(graph, start, goal)
+
+
+def test_changed_graph_is_searched_again():
+  arrMaze, graph = maze(10, 2)
+  dm = DistanceMatrix(graph)
+  dist = dm.tree((0, 0))[0]
+  goal = max(dist, key=lambda b: (dist[b], b))
+  assert dm.distance((0, 0), goal) == ucs_cost(graph, (0, 0), goal) < math.inf
+  for a in list(graph.predecessors(goal)):
+    graph.connect(a, goal, math.inf)
+  assert dm.distance((0, 0), goal) == ucs_cost(graph, (0, 0), goal) == math.inf
+  assert DistanceMatrixAgentProgram(dm)(MazeProblem((0, 0), GoalSet([goal, (0, 0)]), graph)).state == (0, 0)
@@ -0,0 +1,37 @@
+import math
+
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import GreedyBestFirstSearchAgentProgram, BeamSearchAgentProgram
+
+from helpers import ucs_cost, maze_queries, node_cost
+
+
+def valid_path(graph, node, start, goal):
+  states = [n.state for n in node.path()]
+  return states[0] == start and states[-1] == goal and all(b in graph.get(a) for (a, b) in zip(states[:-1], states[1:]))
+
+
+def test_path_cost_evaluation_matches_ucs():
+  program = GreedyBestFirstSearchAgentProgram(evaluation=lambda node: node.path_cost)
+  for (graph, start, goal) in maze_queries():
+    assert node_cost(program(MazeProblem(start, goal, graph))) == ucs_cost(graph, start, goal)
+
+
+def test_unbounded_searches_find_every_reachable_goal():
+  programs = (GreedyBestFirstSearchAgentProgram(math.dist), BeamSearchAgentProgram(math.dist, width=1000))
+  for (graph, start, goal) in maze_queries():
+    best = ucs_cost(graph, start, goal)
+    for program in programs:
+      node = program(MazeProblem(start, goal, graph))
+      if best == math.inf:
+        assert node is None
+      else:
+        assert valid_path(graph, node, start, goal) and node.path_cost >= best
+
+
+def test_bounded_searches_return_valid_paths():
+  programs = (GreedyBestFirstSearchAgentProgram(math.dist, max_frontier=3), BeamSearchAgentProgram(math.dist, width=2))
+  for (graph, start, goal) in maze_queries():
+    for program in programs:
+      node = program(MazeProblem(start, goal, graph))
+      assert node is None or valid_path(graph, node, start, goal)
@@ -0,0 +1,56 @@
+import math
+import random
+
+from src.hpaStarClass import HPAStar
+
+from helpers import ucs_cost, maze, states_cost
+
+
+def test_shape_counts_cells_without_links():
+  arrMaze, graph = maze(5, 18, open_corners=False)
+  hpa = HPAStar(graph, cluster_size=4)
+  assert hpa.shape == (5, 5)
+  assert hpa.query((4, 1), (2, 4)) == (math.inf, None)
+  assert hpa.query((4, 1), (9, 9)) == (math.inf, None)
+
+
+def test_paths_match_reachability_and_cost():
+  rng = random.Random(0)
+  for seed in range(4):
+    arrMaze, graph = maze(23, seed)
+    hpa = HPAStar(graph, cluster_size=5)
+    cells = [(i, j) for i in range(23) for j in range(23)]
+    for _ in range(40):
+      start, goal = rng.choice(cells), rng.choice(cells)
+      best = ucs_cost(graph, start, goal)
+      cost, path = hpa.query(start, goal)
+      if best == math.inf:
+        assert (cost, path) == (math.inf, None)
+        continue
+      assert path[0] == start and path[-1] == goal
+      assert states_cost(graph, path) == cost >= best
+
+
+def test_updated_cells_give_the_same_answers_as_a_new_abstraction():
+  rng = random.Random(1)
+  arrMaze, graph = maze(23, 2)
+  hpa = HPAStar(graph, cluster_size=5)
+  cells = [(i, j) for i in range(23) for j in range(23)]
+  for _ in range(4):
+    #wall off a cell: every link into it gets cost math.inf
+    cell = rng.choice(sorted(graph.origin))
+    changed = [cell] + list(graph.predecessors(cell))
+    for a in changed[1:]:
+      graph.connect(a, cell, math.inf)
+    hpa.update_cells(changed)
+    fresh = HPAStar(graph, cluster_size=5)
+    for _ in range(30):
+      start, goal = rng.choice(cells), rng.choice(cells)
+      best = ucs_cost(graph, start, goal)
+      cost, path = hpa.query(start, goal)
+      assert (cost, path) == fresh.query(start, goal)
+      if best == math.inf:
+        assert path is None
+      else:
+        assert cell not in path[1:]
+        assert states_cost(graph, path) == cost >= best
@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#records every attempt to import a plotting package, installed or not
+CODE = '''
+import atexit, sys
+tried = []
+atexit.register(lambda: print(*tried))
+class Recorder:
+  def find_spec(self, name, path=None, target=None):
+    if name.split('.')[0] in ('matplotlib', 'seaborn'):
+      tried.append(name)
+    return None
+sys.meta_path.insert(0, Recorder())
+import {}
+'''
+
+
+def test_workers_do_not_import_the_plotting_packages():
+  for module in ('src.mazeData', 'src.benchmarks', 'src.batchRunner'):
+    out = subprocess.run([sys.executable, '-c', CODE.format(module)], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == [], module
+
+
+def test_the_recorder_sees_the_drawing_module_import_them():
+  out = subprocess.run([sys.executable, '-c', CODE.format('src.mazeDrawing')], cwd=ROOT, capture_output=True, text=True)
+  assert 'matplotlib' in out.stdout.split()
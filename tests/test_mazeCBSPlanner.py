@@ -0,0 +1,71 @@
+import math
+import random
+
+from src.mazeBatchPlannerClass import MazeBatchPlanner
+from src.mazeCBSPlannerClass import MazeCBSPlanner, WAIT
+from src.naigationEnvironmentClass import MazeNavigationEnvironment
+
+from helpers import ucs_cost, maze, make_agents
+
+
+def waiting_tasks(graph, count=3, seed=0):
+  #random tasks whose CBS plans make an agent wait
+  rng = random.Random(seed)
+  cells = graph.nodes()
+  while True:
+    tasks = [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+    paths = MazeCBSPlanner(graph).solve(tasks)
+    if paths is not None and any(a == b for p in paths for (a, b) in zip(p[:-1], p[1:])):
+      return tasks, paths
+
+
+def test_paths_are_collision_free_moves():
+  arrMaze, graph = maze(8, 1)
+  tasks, paths = waiting_tasks(graph)
+  for ((start, goal), path) in zip(tasks, paths):
+    assert path[0] == start and path[-1] == goal
+    assert all(a == b or b in graph.get(a) for (a, b) in zip(path[:-1], path[1:]))
+  assert MazeCBSPlanner(graph).first_conflict(paths) is None
+
+
+def test_plans_with_waits_run_in_the_environment():
+  arrMaze, graph = maze(8, 1)
+  tasks, paths = waiting_tasks(graph)
+  for run in ('run', 'run_fast'):
+    env = MazeNavigationEnvironment(graph)
+    agents = make_agents(graph, tasks)
+    assert MazeCBSPlanner(graph).add_agents(env, agents)
+    assert any(WAIT in agent.seq for agent in agents)
+    getattr(env, run)(50)
+    assert [agent.state for agent in agents] == [goal for (start, goal) in tasks]
+
+
+def test_batch_plans_run_in_the_environment():
+  arrMaze, graph = maze(8, 1)
+  goal = (7, 7)
+  starts = sorted(graph.nodes())[:12]
+  env = MazeNavigationEnvironment(graph)
+  agents = make_agents(graph, [(start, goal) for start in starts])
+  MazeBatchPlanner(graph).add_agents(env, agents)
+  env.run(50)
+  for (start, agent) in zip(starts, agents):
+    assert agent.state == (goal if ucs_cost(graph, start, goal) < math.inf else start)
+
+
+def test_agents_never_share_a_cell_in_the_environment():
+  #the environment stops an agent on its goal, so a plan passing through it must not
+  for seed in range(6):
+    arrMaze, graph = maze(8, seed)
+    rng = random.Random(seed)
+    cells = graph.nodes()
+    for _ in range(30):
+      ends = rng.sample(cells, 8)
+      tasks = list(zip(ends[:4], ends[4:]))
+      env = MazeNavigationEnvironment(graph)
+      agents = make_agents(graph, tasks)
+      if not MazeCBSPlanner(graph, max_expansions=100).add_agents(env, agents):
+        continue
+      while not env.is_done():
+        env.step()
+        states = [agent.state for agent in agents]
+        assert len(set(states)) == len(states)
@@ -0,0 +1,55 @@
+import math
+import random
+
+from src.graphProblemClass import GraphProblem
+from src.mazeProblemClass import MazeProblem
+from src.PS_agentPrograms import IDA_StarSearchAgentProgram, SMA_StarSearchAgentProgram
+from src.searchStatsClass import SearchStats
+
+from helpers import ucs_cost, maze, maze_queries, romania, node_cost, straight_line, rows_apart
+
+
+def test_romania_costs_match_ucs():
+  graph = romania()
+  for goal in ('Bucharest', 'Iasi', 'Eforie', 'Timisoara'):
+    best = ucs_cost(graph, 'Arad', goal)
+    for program in (IDA_StarSearchAgentProgram(straight_line), SMA_StarSearchAgentProgram(straight_line, memory_limit=20)):
+      assert program(GraphProblem('Arad', goal, graph)).path_cost == best
+
+
+def test_maze_costs_match_ucs():
+  rng = random.Random(0)
+  for seed in range(6):
+    arrMaze, graph = maze(10, seed)
+    cells = [(i, j) for i in range(10) for j in range(10) if arrMaze[i, j]]
+    for _ in range(5):
+      start, goal = rng.choice(cells), rng.choice(cells)
+      best = ucs_cost(graph, start, goal)
+      node = SMA_StarSearchAgentProgram(rows_apart, memory_limit=1000)(MazeProblem(start, goal, graph))
+      assert node_cost(node) == best
+      if best < math.inf:
+        #IDA* only checks the current path, so an unreachable goal takes it exponential time
+        assert IDA_StarSearchAgentProgram(rows_apart)(MazeProblem(start, goal, graph)).path_cost == best
+
+
+def test_sma_star_gives_up_on_unreachable_goal():
+  arrMaze, graph = maze(12, 24)
+  assert ucs_cost(graph, (4, 1), (3, 7)) == math.inf
+  stats = SearchStats()
+  assert SMA_StarSearchAgentProgram(memory_limit=40, stats=stats)(MazeProblem((4, 1), (3, 7), graph)) is None
+  assert stats.expanded < 10000
+
+
+def test_ida_star_gives_up_at_its_budget():
+  arrMaze, graph = maze(12, 24)
+  stats = SearchStats()
+  assert IDA_StarSearchAgentProgram(rows_apart, max_expansions=5000, stats=stats)(MazeProblem((4, 1), (3, 7), graph)) is None
+  assert stats.expanded == 5000
+
+
+def test_sma_star_with_little_memory_gives_up_on_every_unreachable_goal():
+  for (graph, start, goal) in maze_queries():
+    if ucs_cost(graph, start, goal) == math.inf:
+      stats = SearchStats()
+      assert SMA_StarSearchAgentProgram(rows_apart, memory_limit=20, stats=stats)(MazeProblem(start, goal, graph)) is None
+      assert stats.expanded < 2000
@@ -0,0 +1,52 @@
+import itertools
+import math
+
+import pytest
+
+from src.maze2025GraphClass import mazeGraph
+from src.multiGoalPlannerClass import MultiGoalPlanner, held_karp, nearest_neighbor, two_opt, or_opt, path_cost
+
+
+def line_maze():
+  #(0,0) - (0,1) - (0,2) in a row, (2,2) walled off
+  return mazeGraph({(0, 0): {'right': (0, 1)},
+                    (0, 1): {'left': (0, 0), 'right': (0, 2)},
+                    (0, 2): {'left': (0, 1)},
+                    (2, 2): {}})
+
+
+def test_unreachable_goal_is_left_out_and_reported():
+  planner = MultiGoalPlanner(line_maze())
+  assert planner((0, 0), [(0, 2), (2, 2), (0, 1)]) == [(0, 1), (0, 2)]
+  assert planner.unreachable == [(2, 2)]
+
+
+def test_unreachable_goal_with_the_heuristic_orders():
+  planner = MultiGoalPlanner(line_maze(), exact_limit=0)
+  assert sorted(planner((0, 0), [(0, 2), (2, 2), (0, 1)])) == [(0, 1), (0, 2)]
+  assert planner.unreachable == [(2, 2)]
+
+
+def test_infinite_column_raises():
+  inf = math.inf
+  d = [[0, 1, 2, inf], [1, 0, 1, inf], [2, 1, 0, inf], [inf, inf, inf, 0]]
+  with pytest.raises(ValueError):
+    held_karp(d)
+  with pytest.raises(ValueError):
+    nearest_neighbor(d)
+  with pytest.raises(ValueError):
+    two_opt(d, [0, 1, 2, 3])
+  with pytest.raises(ValueError):
+    or_opt(d, [0, 1, 2, 3])
+
+
+def test_held_karp_is_optimal_permutation():
+  points = [(0, 0), (3, 1), (1, 4), (5, 5), (2, 2), (4, 0)]
+  d = [[math.dist(a, b) for b in points] for a in points]
+  order = held_karp(d)
+  assert sorted(order) == list(range(len(points))) and order[0] == 0
+  best = min(path_cost(d, [0] + list(p)) for p in itertools.permutations(range(1, len(points))))
+  assert path_cost(d, order) == pytest.approx(best)
+  heuristic = or_opt(d, two_opt(d, nearest_neighbor(d)))
+  assert sorted(heuristic) == list(range(len(points)))
+  assert path_cost(d, heuristic) >= best - 1e-9
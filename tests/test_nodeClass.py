@@ -0,0 +1,52 @@
+import pytest
+
+from src.graphProblemClass import GraphProblem
+from src.nodeClass import Node, CompactNode, TracingNode
+
+from helpers import romania
+
+
+def walk(root, problem, states):
+  #follow the children of root through the given states
+  node = root
+  for state in states:
+    node = next(child for child in node.expand(problem) if child.state == state)
+  return node
+
+
+def test_compact_nodes_give_the_same_paths_as_nodes():
+  problem = GraphProblem('Arad', 'Bucharest', romania())
+  route = ['Sibiu', 'Rimnicu', 'Pitesti', 'Bucharest']
+  expected = walk(Node('Arad'), problem, route)
+  for kind in (CompactNode, TracingNode):
+    node = walk(kind('Arad'), problem, route)
+    assert type(node) is kind
+    assert (node.path_cost, node.depth) == (expected.path_cost, expected.depth) == (418, 4)
+    assert node.solution() == expected.solution() == route
+    assert [n.state for n in node.path()] == [n.state for n in expected.path()]
+
+
+def test_children_are_generated_one_at_a_time():
+  problem = GraphProblem('Arad', 'Bucharest', romania())
+  children = CompactNode('Arad').expand(problem)
+  assert not isinstance(children, list)
+  assert sorted(child.state for child in children) == sorted(n.state for n in Node('Arad').expand(problem))
+
+
+def test_equality_is_symmetric():
+  node, compact, tracing = Node('Arad'), CompactNode('Arad'), TracingNode('Arad')
+  for (a, b) in ((node, compact), (compact, node), (node, tracing), (tracing, node)):
+    assert a != b and not a == b
+  assert compact == tracing and tracing == compact
+  assert compact != CompactNode('Sibiu') and CompactNode('Arad') < CompactNode('Sibiu')
+  with pytest.raises(TypeError):
+    hash(compact)
+
+
+def test_only_tracing_nodes_keep_a_color():
+  compact, tracing = CompactNode('Arad'), TracingNode('Arad')
+  assert not hasattr(compact, '__dict__') and not hasattr(tracing, '__dict__')
+  with pytest.raises(AttributeError):
+    compact.color = 'orange'
+  tracing.color = 'orange'
+  assert (compact.color, tracing.color, TracingNode('Arad').color) == ('white', 'orange', 'white')
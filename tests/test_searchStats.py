@@ -0,0 +1,30 @@
+import pytest
+
+from src.algorithms import AC3, backtracking_search
+from src.CSPS import MapColoringCSP
+from src.searchStatsClass import SearchStats
+
+
+def australia():
+  neighbors = {'WA': ['NT', 'SA'], 'NT': ['WA', 'SA', 'Q'], 'SA': ['WA', 'NT', 'Q', 'NSW', 'V'],
+               'Q': ['NT', 'SA', 'NSW'], 'NSW': ['Q', 'SA', 'V'], 'V': ['SA', 'NSW'], 'T': []}
+  return MapColoringCSP(list('RGB'), neighbors)
+
+
+def test_csp_solvers_count_into_stats():
+  stats = SearchStats()
+  assert AC3(australia(), stats=stats)[0]
+  assert stats.checks > 0 and 'total' in stats.times
+  stats = SearchStats()
+  assert backtracking_search(australia(), stats=stats) is not None
+  assert stats.assignments >= 7
+  assert backtracking_search(australia(), stats=None) is not None
+
+
+def test_ac3_stops_the_clock_when_it_fails():
+  csp = australia()
+  csp.neighbors['T'] = ['Mars']
+  stats = SearchStats()
+  with pytest.raises(KeyError):
+    AC3(csp, stats=stats)
+  assert 'total' in stats.times
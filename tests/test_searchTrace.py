@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from src.searchTraceClass import SearchTrace
+
+
+def traces(steps=100, keyframe_every=8):
+  #a SearchTrace and the list of full color dicts it replaces
+  rng = random.Random(0)
+  nodes = ['A', 'B', 'C', 'D']
+  trace = SearchTrace(nodes, keyframe_every=keyframe_every)
+  colors = {node: 'white' for node in nodes}
+  frames = []
+  for step in range(steps):
+    #a node not given at the start shows up later
+    node = rng.choice(nodes + ['E'] if step > steps // 2 else nodes)
+    color = rng.choice(['orange', 'red', 'green'])
+    trace.record(node, color)
+    colors[node] = color
+    frames.append(dict(colors))
+  #every frame lists all the nodes, white until they are first colored
+  return trace, [{node: frame.get(node, 'white') for node in trace.nodes} for frame in frames]
+
+
+def test_frames_match_around_the_keyframes():
+  trace, frames = traces()
+  assert len(trace) == len(frames)
+  for step in range(len(frames)):
+    assert trace[step] == frames[step]
+  for k in range(1, len(frames) // 8 + 1):
+    for step in (8 * k - 2, 8 * k - 1, 8 * k):
+      if step < len(frames):
+        assert trace[step] == frames[step]
+
+
+def test_negative_steps_and_slices():
+  trace, frames = traces()
+  for step in (-1, -2, -8, -9, -len(frames)):
+    assert trace[step] == frames[step]
+  for s in (slice(None), slice(5, 40, 3), slice(-20, None), slice(None, None, -7), slice(90, 200), slice(30, 10)):
+    assert trace[s] == frames[s]
+  with pytest.raises(IndexError):
+    trace[len(frames)]
+  with pytest.raises(IndexError):
+    trace[-len(frames) - 1]
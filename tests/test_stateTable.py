@@ -0,0 +1,9 @@
+from src.stateTableClass import StateTable
+
+
+def test_ids_are_dense_and_stable():
+  table = StateTable()
+  assert [table.id_of(s) for s in [(0, 0), (0, 1), (0, 0), 'Arad']] == [0, 1, 0, 2]
+  assert table.state_of(1) == (0, 1)
+  assert (0, 1) in table and (1, 1) not in table
+  assert len(table) == 3
@@ -0,0 +1,31 @@
+from src.algorithms import AC3
+from src.CSPS import MapColoringCSP
+from src.mazeProblemClass import MazeProblem
+from src.naigationEnvironmentClass import MazeNavigationEnvironment
+from src.mazeProblemSolvingAgentClass import MazeProblemSolvingAgent
+from src.PS_agentPrograms import A_StarSearchAgentProgram
+from src.tracerClass import FileTracer, MemoryTracer
+
+from helpers import maze
+
+
+def test_memory_tracer_collects_messages():
+  triangle = lambda: MapColoringCSP(list('RGB'), {'A': ['B', 'C'], 'B': ['A', 'C'], 'C': ['A', 'B']})
+  tracer = MemoryTracer()
+  assert AC3(triangle(), tracer=tracer)[0]
+  assert tracer.messages[0] == 'Initial queue:'
+  assert AC3(triangle(), tracer=None)[0]
+
+
+def test_file_tracer_closes_its_file(tmp_path):
+  arrMaze, graph = maze(6, 0)
+  filename = tmp_path / 'run.log'
+  with FileTracer(filename) as tracer:
+    A_StarSearchAgentProgram(tracer=tracer)(MazeProblem((0, 0), (5, 5), graph))
+    env = MazeNavigationEnvironment(graph, tracer=tracer)
+    agent = MazeProblemSolvingAgent((0, 0), graph, (0, 1))
+    agent.performance, agent.seq = 10, ['right']
+    env.agents.append(agent)
+    env.run(5)
+  assert tracer.file.closed
+  assert filename.read_text().splitlines()[0] == 'Hi'
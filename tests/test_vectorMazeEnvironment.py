@@ -0,0 +1,19 @@
+from src.mazeCBSPlannerClass import MazeCBSPlanner
+from src.naigationEnvironmentClass import MazeNavigationEnvironment
+from src.vectorMazeEnvironmentClass import VectorMazeEnvironment
+
+from helpers import maze, make_agents
+
+
+def test_same_end_cells_as_the_object_environment():
+  arrMaze, graph = maze(10, 4)
+  cells = sorted(graph.nodes())
+  tasks = [(cells[i], cells[-1 - 3 * i]) for i in range(6)]
+  agents = make_agents(graph, tasks)
+  env = MazeNavigationEnvironment(graph)
+  assert MazeCBSPlanner(graph).add_agents(env, agents)
+  vector = VectorMazeEnvironment(arrMaze)
+  vector.add_maze_agents(agents)
+  env.run(60)
+  vector.run(60)
+  assert [agent.state for agent in agents] == list(zip(vector.row.tolist(), vector.col.tolist()))